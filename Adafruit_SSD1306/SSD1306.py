@@ -19,13 +19,24 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 from __future__ import division
+import contextlib
 import logging
+import threading
 import time
 
-import Adafruit_GPIO as GPIO
-import Adafruit_GPIO.SPI as SPI
+from .cache import ImageCache, image_key
+from .convert import (bytes_to_pages, dither_to_pages, DITHER_THRESHOLD,
+                      DITHER_BAYER, DITHER_FLOYD_STEINBERG)
+from .framebuf import PageBuffer
+from .stats import BusStats
 
 
+_now = getattr(time, 'monotonic', time.time)
+
+# Output pin mode, the value of Adafruit_GPIO.OUT, so GPIO adapters passed in
+# don't need Adafruit_GPIO imported.
+_GPIO_OUT = 0
+
 # Constants
 SSD1306_I2C_ADDRESS = 0x3C    # 011110+SA0+RW - 0x3C or 0x3D
 SSD1306_SETCONTRAST = 0x81
@@ -53,6 +64,19 @@ SSD1306_SEGREMAP = 0xA0
 SSD1306_CHARGEPUMP = 0x8D
 SSD1306_EXTERNALVCC = 0x1
 SSD1306_SWITCHCAPVCC = 0x2
+SSD1306_RAM_PAGES = 8         # Pages of display RAM, whatever the panel height.
+
+# I2C data transfer strategies
+SSD1306_I2C_AUTO = 'auto'      # Bulk writes when supported, else block writes.
+SSD1306_I2C_BULK = 'bulk'      # Control byte and a large chunk in one message.
+SSD1306_I2C_BLOCK = 'block'    # SMBus block sized writeList calls.
+SSD1306_I2C_BLOCK_SIZE = 16    # Default block write size.
+SSD1306_I2C_BLOCK_MAX = 32     # Largest SMBus block write.
+
+# Dithering methods for image()
+SSD1306_DITHER_THRESHOLD = DITHER_THRESHOLD                 # Fixed threshold.
+SSD1306_DITHER_BAYER = DITHER_BAYER                         # 8x8 ordered dither.
+SSD1306_DITHER_FLOYD_STEINBERG = DITHER_FLOYD_STEINBERG     # Error diffusion.
 
 # Scrolling constants
 SSD1306_ACTIVATE_SCROLL = 0x2F
@@ -63,30 +87,139 @@ SSD1306_LEFT_HORIZONTAL_SCROLL = 0x27
 SSD1306_VERTICAL_AND_RIGHT_HORIZONTAL_SCROLL = 0x29
 SSD1306_VERTICAL_AND_LEFT_HORIZONTAL_SCROLL = 0x2A
 
+# Scroll step intervals in frames and the value the scroll setup commands take
+# for each.
+SSD1306_SCROLL_INTERVALS = {2: 0x7, 3: 0x4, 4: 0x5, 5: 0x0, 25: 0x6,
+                            64: 0x1, 128: 0x2, 256: 0x3}
+
+
+class SSD1306InitProfile(object):
+    """Initialization settings for a panel: its multiplex ratio and COM pins
+    configuration, the display clock divider, and the contrast, precharge
+    period and charge pump setting for each VCC mode, as dicts keyed by
+    SSD1306_EXTERNALVCC and SSD1306_SWITCHCAPVCC.  The command bytes for each
+    VCC mode are built the first time they are asked for and kept.
+    """
+
+    def __init__(self, multiplex, compins, clockdiv, contrast, precharge,
+                 chargepump, vcomdetect=0x40):
+        self.multiplex = multiplex
+        self.compins = compins
+        self.clockdiv = clockdiv
+        self.contrast = contrast
+        self.precharge = precharge
+        self.chargepump = chargepump
+        self.vcomdetect = vcomdetect
+        self._compiled = {}
+
+    def commands(self, vccstate):
+        """Return the initialization command bytes for vccstate."""
+        compiled = self._compiled.get(vccstate)
+        if compiled is None:
+            compiled = bytes(bytearray([
+                SSD1306_DISPLAYOFF,
+                SSD1306_SETDISPLAYCLOCKDIV, self.clockdiv,
+                SSD1306_SETMULTIPLEX, self.multiplex,
+                SSD1306_SETDISPLAYOFFSET, 0x0,               # no offset
+                SSD1306_SETSTARTLINE | 0x0,                  # line #0
+                SSD1306_CHARGEPUMP, self.chargepump[vccstate],
+                SSD1306_MEMORYMODE, 0x00,                    # act like ks0108
+                SSD1306_SEGREMAP | 0x1,
+                SSD1306_COMSCANDEC,
+                SSD1306_SETCOMPINS, self.compins,
+                SSD1306_SETCONTRAST, self.contrast[vccstate],
+                SSD1306_SETPRECHARGE, self.precharge[vccstate],
+                SSD1306_SETVCOMDETECT, self.vcomdetect,
+                SSD1306_DISPLAYALLON_RESUME,
+                SSD1306_NORMALDISPLAY]))
+            self._compiled[vccstate] = compiled
+        return compiled
+
+
+# Initialization profiles of the supported panels.
+SSD1306_PROFILE_128_64 = SSD1306InitProfile(
+    multiplex=0x3F, compins=0x12, clockdiv=0x80,
+    contrast={SSD1306_EXTERNALVCC: 0x9F, SSD1306_SWITCHCAPVCC: 0xCF},
+    precharge={SSD1306_EXTERNALVCC: 0x22, SSD1306_SWITCHCAPVCC: 0xF1},
+    chargepump={SSD1306_EXTERNALVCC: 0x10, SSD1306_SWITCHCAPVCC: 0x14})
+SSD1306_PROFILE_128_32 = SSD1306InitProfile(
+    multiplex=0x1F, compins=0x02, clockdiv=0x80,
+    contrast={SSD1306_EXTERNALVCC: 0x8F, SSD1306_SWITCHCAPVCC: 0x8F},
+    precharge={SSD1306_EXTERNALVCC: 0x22, SSD1306_SWITCHCAPVCC: 0xF1},
+    chargepump={SSD1306_EXTERNALVCC: 0x10, SSD1306_SWITCHCAPVCC: 0x14})
+SSD1306_PROFILE_96_16 = SSD1306InitProfile(
+    multiplex=0x0F, compins=0x02, clockdiv=0x60,
+    contrast={SSD1306_EXTERNALVCC: 0x8F, SSD1306_SWITCHCAPVCC: 0x8F},
+    precharge={SSD1306_EXTERNALVCC: 0x22, SSD1306_SWITCHCAPVCC: 0xF1},
+    chargepump={SSD1306_EXTERNALVCC: 0x10, SSD1306_SWITCHCAPVCC: 0x14})
 
-class SSD1306Base(object):
+
+class SSD1306Base(PageBuffer):
     """Base class for SSD1306-based OLED displays.  Implementors should subclass
-    and provide an implementation for the _initialize function.
+    and set profile to an SSD1306InitProfile, or provide an implementation for
+    the _initialize function.
     """
 
+    # SSD1306InitProfile used by _initialize.
+    profile = None
+
     def __init__(self, width, height, rst, dc=None, sclk=None, din=None, cs=None,
                  gpio=None, spi=None, i2c_bus=None, i2c_address=SSD1306_I2C_ADDRESS,
-                 i2c=None):
+                 i2c=None, i2c_transfer=SSD1306_I2C_AUTO, i2c_chunk_size=None):
+        started = _now()
+        # Seconds spent in the constructor, begin() and its parts, see timings.
+        self.timings = {}
         self._log = logging.getLogger('Adafruit_SSD1306.SSD1306Base')
         self._spi = None
         self._i2c = None
         self.width = width
         self.height = height
         self._pages = height//8
-        self._buffer = [0]*(width*self._pages)
-        # Default to platform GPIO if not provided.
+        # Frame buffer in page format, sent to the transport through memoryview
+        # slices so display() doesn't copy it.
+        self._buffer = bytearray(width*self._pages)
+        self._view = memoryview(self._buffer)
+        self._blank = bytearray(width*self._pages)
+        # Scratch space to gather windows narrower than the display.
+        self._scratch = bytearray(width*self._pages)
+        self._scratch_view = memoryview(self._scratch)
+        # Model of the display RAM, page by page, and which of its pages are
+        # known to hold what the model says.  Unknown pages are always sent.
+        self._ram = bytearray(SSD1306_RAM_PAGES*width)
+        self._ram_view = memoryview(self._ram)
+        self._ram_known = [False]*SSD1306_RAM_PAGES
+        # Page p of the buffer lives in RAM page (p + _page_offset) % 8, and
+        # the display start line shows it at the top.  See ring_scroll().
+        self._page_offset = 0
+        self._start_line = 0
+        # True to draw each frame into RAM that isn't shown, see set_page_flip().
+        self._page_flip = False
+        # Command bytes queued by batch(), None when not batching.
+        self._commands = None
+        # True while the controller is scrolling on its own.
+        self._scrolling = False
+        # Last level driven on the DC pin, None until the first SPI write.
+        self._dc_high = None
+        # Serializes bus access between callers and the render thread.
+        self._lock = threading.RLock()
+        # Background render thread state, see display_async().
+        self._render_thread = None
+        self._render_cond = threading.Condition()
+        self._render_pending = False
+        self._render_busy = False
+        self._render_stop = False
+        self._render_error = None
+        self.dropped_frames = 0
+        # BusStats counting bus traffic and latencies, None when disabled.
+        self._stats = None
+        # ImageCache of converted images, None when disabled.
+        self._image_cache = None
+        # GPIO adapter, the platform GPIO is looked up the first time a pin is
+        # used if one isn't provided.  Pins are set up as outputs on first use.
         self._gpio = gpio
-        if self._gpio is None:
-            self._gpio = GPIO.get_platform_gpio()
-        # Setup reset pin.
+        self._ready_pins = set()
         self._rst = rst
-        if not self._rst is None:
-            self._gpio.setup(self._rst, GPIO.OUT)
+        self._dc = dc
         # Handle hardware SPI
         if spi is not None:
             self._log.debug('Using hardware SPI')
@@ -95,7 +228,8 @@ class SSD1306Base(object):
         # Handle software SPI
         elif sclk is not None and din is not None and cs is not None:
             self._log.debug('Using software SPI')
-            self._spi = SPI.BitBang(self._gpio, sclk, din, None, cs)
+            import Adafruit_GPIO.SPI as SPI
+            self._spi = SPI.BitBang(self._platform_gpio(), sclk, din, None, cs)
         # Handle hardware I2C
         elif i2c is not None:
             self._log.debug('Using hardware I2C with custom I2C provider.')
@@ -107,118 +241,765 @@ class SSD1306Base(object):
                 self._i2c = I2C.get_i2c_device(i2c_address)
             else:
                 self._i2c = I2C.get_i2c_device(i2c_address, busnum=i2c_bus)
-        # Initialize DC pin if using SPI.
+        # Check for a DC pin if using SPI.
         if self._spi is not None:
             if dc is None:
                 raise ValueError('DC pin must be provided when using SPI.')
-            self._dc = dc
-            self._gpio.setup(self._dc, GPIO.OUT)
+        else:
+            self._setup_i2c_transfer(i2c_transfer, i2c_chunk_size)
+        self.timings['init'] = _now() - started
+
+    def _platform_gpio(self):
+        # Return the GPIO adapter, looking up the platform GPIO the first time
+        # when none was provided.  Platform detection can be slow.
+        if self._gpio is None:
+            started = _now()
+            import Adafruit_GPIO as GPIO
+            self._gpio = GPIO.get_platform_gpio()
+            self.timings['gpio'] = _now() - started
+        return self._gpio
+
+    def _pin(self, pin):
+        # Return the GPIO adapter after setting pin up as an output, once.
+        gpio = self._platform_gpio()
+        if pin not in self._ready_pins:
+            gpio.setup(pin, _GPIO_OUT)
+            self._ready_pins.add(pin)
+        return gpio
+
+    def _setup_i2c_transfer(self, transfer, chunk_size):
+        # Pick how display data is written to the I2C device.  Bulk writes send
+        # the 0x40 control byte and up to chunk_size data bytes as one message,
+        # block writes use SMBus sized writeList calls.
+        if transfer not in (SSD1306_I2C_AUTO, SSD1306_I2C_BULK, SSD1306_I2C_BLOCK):
+            raise ValueError('Unknown I2C transfer mode {0}.'.format(transfer))
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('I2C chunk size must be at least 1 byte.')
+        if transfer == SSD1306_I2C_BLOCK and chunk_size is not None and \
+           chunk_size > SSD1306_I2C_BLOCK_MAX:
+            raise ValueError('I2C block writes take at most {0} bytes.'.format(
+                SSD1306_I2C_BLOCK_MAX))
+        self._i2c_transfer = transfer
+        self._i2c_chunk_size = chunk_size
+        self._i2c_bulk = None
+        if transfer != SSD1306_I2C_BLOCK:
+            self._i2c_bulk = self._find_i2c_bulk()
+            if self._i2c_bulk is None and transfer == SSD1306_I2C_BULK:
+                raise ValueError('I2C provider does not support bulk writes.')
+        if self._i2c_bulk is not None:
+            self._i2c_chunk = min(chunk_size or len(self._buffer), len(self._buffer))
+            # Control byte followed by the largest chunk, assembled in place.
+            self._i2c_out = bytearray(1 + self._i2c_chunk)
+            self._i2c_out_view = memoryview(self._i2c_out)
+        else:
+            self._i2c_chunk = min(chunk_size or SSD1306_I2C_BLOCK_SIZE,
+                                  SSD1306_I2C_BLOCK_MAX)
+        self._log.debug('Using {0} I2C data writes of up to {1} bytes.'.format(
+            'bulk' if self._i2c_bulk is not None else 'block', self._i2c_chunk))
+
+    def _find_i2c_bulk(self):
+        # Return a function that writes raw bytes to the I2C device as a single
+        # message, or None if the device can't do that.  Providers can offer a
+        # writeBytes method, otherwise look for the Adafruit_PureIO bus behind
+        # an Adafruit_GPIO I2C device.
+        write = getattr(self._i2c, 'writeBytes', None)
+        if write is not None:
+            return write
+        bus = getattr(self._i2c, '_bus', None)
+        address = getattr(self._i2c, '_address', None)
+        if address is not None and hasattr(bus, 'write_bytes'):
+            return lambda data: bus.write_bytes(address, data)
+        return None
 
     def _initialize(self):
-        raise NotImplementedError
+        # Send the profile's initialization commands.
+        if self.profile is None:
+            raise NotImplementedError
+        self.commands(*self.profile.commands(self._vccstate))
 
     def command(self, c):
         """Send command byte to display."""
+        stats = self._stats
+        if stats is not None:
+            start = _now()
+        with self._lock:
+            if self._commands is not None:
+                self._commands.append(c)
+            elif self._spi is not None:
+                # SPI write.
+                self._set_dc(False)
+                self._spi.write([c])
+                if stats is not None:
+                    stats.write(1, 0)
+            else:
+                # I2C write.
+                control = 0x00   # Co = 0, DC = 0
+                self._i2c.write8(control, c)
+                if stats is not None:
+                    stats.write(1, 2)
+        if stats is not None:
+            stats.time('command', _now() - start)
+
+    def commands(self, *cmds):
+        """Send several command bytes to display in a single transfer."""
+        stats = self._stats
+        if stats is not None:
+            start = _now()
+        with self._lock:
+            if self._commands is not None:
+                self._commands.extend(cmds)
+            else:
+                self._write_commands(bytearray(cmds))
+        if stats is not None:
+            stats.time('commands', _now() - start)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Context manager that queues the bytes of command() and commands()
+        calls and sends them in a single transfer when the block ends, or
+        before any display data is written in the block.  Nested batches
+        join the outer one.
+        """
+        with self._lock:
+            if self._commands is not None:
+                yield
+                return
+            self._commands = []
+            try:
+                yield
+                self._flush_commands()
+            finally:
+                self._commands = None
+
+    def _flush_commands(self):
+        # Send any command bytes queued by batch() and keep batching.
+        if self._commands:
+            cmds = bytearray(self._commands)
+            del self._commands[:]
+            self._write_commands(cmds)
+
+    def _write_commands(self, cmds):
+        # Send a run of command bytes.
         if self._spi is not None:
-            # SPI write.
-            self._gpio.set_low(self._dc)
-            self._spi.write([c])
+            self._set_dc(False)
+            self._spi.write(cmds)
+            if self._stats is not None:
+                self._stats.write(len(cmds), 0)
         else:
-            # I2C write.
-            control = 0x00   # Co = 0, DC = 0
-            self._i2c.write8(control, c)
+            self._write_i2c(0x00, cmds)   # Co = 0, DC = 0
 
     def data(self, c):
         """Send byte of data to display."""
-        if self._spi is not None:
-            # SPI write.
-            self._gpio.set_high(self._dc)
-            self._spi.write([c])
+        stats = self._stats
+        if stats is not None:
+            start = _now()
+        with self._lock:
+            if self._commands:
+                self._flush_commands()
+            if self._spi is not None:
+                # SPI write.
+                self._set_dc(True)
+                self._spi.write([c])
+                if stats is not None:
+                    stats.write(1, 0)
+            else:
+                # I2C write.
+                control = 0x40   # Co = 0, DC = 1
+                self._i2c.write8(control, c)
+                if stats is not None:
+                    stats.write(1, 2)
+        if stats is not None:
+            stats.time('data', _now() - start)
+
+    def _set_dc(self, high):
+        # Drive the DC pin, skipping the GPIO call when it is already there.
+        if self._dc_high is high:
+            return
+        gpio = self._pin(self._dc)
+        if high:
+            gpio.set_high(self._dc)
         else:
-            # I2C write.
-            control = 0x40   # Co = 0, DC = 0
-            self._i2c.write8(control, c)
+            gpio.set_low(self._dc)
+        self._dc_high = high
+        if self._stats is not None:
+            self._stats.dc_toggle()
 
-    def begin(self, vccstate=SSD1306_SWITCHCAPVCC):
-        """Initialize display."""
+    def begin(self, vccstate=SSD1306_SWITCHCAPVCC, warm=False):
+        """Initialize display.  With warm, the display is taken over as it is,
+        already initialized and powered by an earlier process: it isn't reset
+        or initialized again and keeps showing what it shows, only scrolling
+        is stopped and the addressing this class relies on is set up.  The
+        first display() after a warm begin sends the whole buffer.
+
+        The time it took is kept in the timings dict under 'begin', next to
+        'init' for the constructor and 'gpio' for the platform GPIO lookup.
+        """
+        started = _now()
         # Save vcc state.
         self._vccstate = vccstate
-        # Reset and initialize display.
-        self.reset()
-        self._initialize()
-        # Turn on the display.
-        self.command(SSD1306_DISPLAYON)
+        if warm:
+            self._attach()
+        else:
+            # Reset and initialize display.
+            self.reset()
+            self._setup()
+        self.timings['begin'] = _now() - started
+
+    def _setup(self):
+        # Send the initialization commands and turn on the display.
+        with self.batch():
+            self._initialize()
+            # Turn on the display.
+            self.command(SSD1306_DISPLAYON)
+        self._reset_state()
+
+    def _attach(self):
+        # Set up addressing on a display that is already running.
+        self.commands(SSD1306_DEACTIVATE_SCROLL,
+                      SSD1306_MEMORYMODE, 0x00,
+                      SSD1306_SETSTARTLINE | 0x0,
+                      SSD1306_COLUMNADDR, 0, self.width - 1,
+                      SSD1306_PAGEADDR, 0, SSD1306_RAM_PAGES - 1)
+        self._reset_state()
+
+    def _reset_state(self):
+        # What is in display RAM is unknown, and the start line is back at 0.
+        self.invalidate()
+        self._scrolling = False
+        self._page_offset = 0
+        self._start_line = 0
 
     def reset(self):
         """Reset the display."""
         if self._rst is None:
             return
+        stats = self._stats
+        if stats is not None:
+            start = _now()
+        self.invalidate()
+        gpio = self._pin(self._rst)
         # Set reset high for a millisecond.
-        self._gpio.set_high(self._rst)
+        gpio.set_high(self._rst)
         time.sleep(0.001)
         # Set reset low for 10 milliseconds.
-        self._gpio.set_low(self._rst)
+        gpio.set_low(self._rst)
         time.sleep(0.010)
         # Set reset high again.
-        self._gpio.set_high(self._rst)
+        gpio.set_high(self._rst)
+        if stats is not None:
+            stats.time('reset', _now() - start)
 
     def display(self):
-        """Write display buffer to physical display."""
-        self.command(SSD1306_COLUMNADDR)
-        self.command(0)              # Column start address. (0 = reset)
-        self.command(self.width-1)   # Column end address.
-        self.command(SSD1306_PAGEADDR)
-        self.command(0)              # Page start address. (0 = reset)
-        self.command(self._pages-1)  # Page end address.
-        # Write buffer data.
+        """Write display buffer to physical display.  Only the pages and columns
+        that changed since the last call are sent, unless a full update is
+        cheaper.  Scrolling started with start_scroll() is stopped first.
+        """
+        stats = self._stats
+        if stats is not None:
+            start = _now()
+        if self._render_thread is not None:
+            # This frame supersedes one still waiting for the render thread.
+            with self._render_cond:
+                if self._render_pending:
+                    self._render_pending = False
+                    self.dropped_frames += 1
+        self._send_frame(self._buffer, self._view)
+        if stats is not None:
+            stats.time('display', _now() - start)
+            stats.frame_done()
+
+    def display_async(self):
+        """Queue a copy of the display buffer to be written to the physical
+        display by a background render thread and return immediately.  The
+        thread is started on first use.  If the previous frame hasn't started
+        going out yet it is dropped in favor of this one and counted in the
+        dropped_frames attribute.  Use flush() to wait for queued frames.
+        """
+        with self._render_cond:
+            if self._render_thread is None:
+                self._start_render_thread()
+            if self._render_pending:
+                self.dropped_frames += 1
+            self._back[:] = self._buffer
+            self._render_pending = True
+            self._render_cond.notify_all()
+
+    def flush(self, timeout=None):
+        """Wait until every frame queued with display_async() has been written
+        to the display.  Returns False if timeout seconds passed first.  An
+        exception raised while the render thread wrote a frame is raised here.
+        """
+        deadline = None if timeout is None else _now() + timeout
+        with self._render_cond:
+            while self._render_pending or self._render_busy:
+                remaining = None if deadline is None else deadline - _now()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._render_cond.wait(remaining)
+            error, self._render_error = self._render_error, None
+        if error is not None:
+            raise error
+        return True
+
+    def stop_render_thread(self):
+        """Write any queued frame and stop the display_async() render thread."""
+        with self._render_cond:
+            thread = self._render_thread
+            if thread is None:
+                return
+            self._render_stop = True
+            self._render_cond.notify_all()
+        thread.join()
+        with self._render_cond:
+            self._render_thread = None
+            self._render_stop = False
+
+    def _start_render_thread(self):
+        # Back buffer filled by display_async() and the buffer being written by
+        # the render thread, swapped each time a frame is picked up.
+        self._back = bytearray(len(self._buffer))
+        self._front = bytearray(len(self._buffer))
+        self._render_thread = threading.Thread(target=self._render_loop,
+                                               name='SSD1306 render')
+        self._render_thread.daemon = True
+        self._render_thread.start()
+
+    def _render_loop(self):
+        cond = self._render_cond
+        while True:
+            with cond:
+                while not self._render_pending and not self._render_stop:
+                    cond.wait()
+                if not self._render_pending:
+                    return
+                self._back, self._front = self._front, self._back
+                self._render_pending = False
+                self._render_busy = True
+            try:
+                self._send_frame(self._front, memoryview(self._front))
+            except Exception as ex:
+                self._log.exception('Render thread failed to write frame.')
+                self._render_error = ex
+            finally:
+                with cond:
+                    self._render_busy = False
+                    cond.notify_all()
+
+    def _send_frame(self, frame, view):
+        # Bring the display up to date with frame, a bytearray in page format.
+        with self._lock:
+            if self._scrolling:
+                self.stop_scroll()
+            windows = self._dirty_windows(frame)
+            if self._page_flip and windows:
+                # Write the frame to the hidden half of RAM instead, comparing
+                # it with the frame that was shown before the current one.
+                self._page_offset = (self._page_offset + self._pages) % \
+                    SSD1306_RAM_PAGES
+                windows = self._dirty_windows(frame)
+            for window in windows:
+                self._write_window(view, *window)
+            # Remember what is now in each RAM page.
+            width = self.width
+            ram = self._ram_view
+            for page in range(self._pages):
+                ram_page = (page + self._page_offset) % SSD1306_RAM_PAGES
+                ram[ram_page*width:(ram_page+1)*width] = \
+                    view[page*width:(page+1)*width]
+                self._ram_known[ram_page] = True
+            # Show the frame from its first RAM page on, after it is written.
+            start_line = self._page_offset*8
+            if start_line != self._start_line:
+                self.command(SSD1306_SETSTARTLINE | start_line)
+                self._start_line = start_line
+
+    def enable_stats(self, stats=None):
+        """Start counting bus transactions, bytes, DC pin changes and the
+        latency of command(), data(), display(), image() and reset() calls.
+        Counts go to stats, a BusStats instance, or a new one if not provided.
+        Returns the BusStats in use.  Counting is off by default and costs
+        next to nothing then.
+        """
+        if stats is None:
+            stats = BusStats()
+        with self._lock:
+            self._stats = stats
+        return stats
+
+    def disable_stats(self):
+        """Stop counting bus traffic and latencies."""
+        with self._lock:
+            self._stats = None
+
+    @property
+    def stats(self):
+        """BusStats counting this display's traffic, or None when disabled."""
+        return self._stats
+
+    def invalidate(self):
+        """Forget what is on the physical display so the next call to display()
+        sends the whole buffer.
+        """
+        self._ram_known = [False]*SSD1306_RAM_PAGES
+
+    def set_page_flip(self, enabled):
+        """Turn double buffering in display RAM on or off.  Panels shorter than
+        64 rows, like the 128x32 and 96x16 ones, only show part of the RAM.
+        With page flipping on, display() writes each new frame into the part
+        that isn't shown and then moves the display start line to it with a
+        single command, so a slow transfer never shows a half written frame.
+        """
+        if enabled and self._pages*2 > SSD1306_RAM_PAGES:
+            raise ValueError('Page flipping needs a display at most 32 rows high.')
+        with self._lock:
+            self._page_flip = bool(enabled)
+
+    def ring_scroll(self, pages=1):
+        """Scroll the buffer up by whole pages, clearing the pages that come in
+        at the bottom, without resending what is already on the display.  The
+        display RAM is used as a ring and the display start line is moved to
+        show the shifted view, so the next display() only writes what is drawn
+        into the new pages plus one command.  Coordinates in the buffer stay
+        the same, page 0 is always the top of the display, and start_scroll()
+        pages are buffer pages too.
+        """
+        if not 0 < pages <= self._pages:
+            raise ValueError('Pages must be from 1 to {0}.'.format(self._pages))
+        if self._page_flip:
+            raise ValueError('Ring scrolling can\'t be used with page flipping.')
+        width = self.width
+        keep = (self._pages - pages)*width
+        with self._lock:
+            self._view[:keep] = self._view[pages*width:]
+            self._view[keep:] = self._blank[keep:]
+            self._page_offset = (self._page_offset + pages) % SSD1306_RAM_PAGES
+
+    def _window_cost(self, columns, pages):
+        # Estimated bytes on the bus to send a window, including the six
+        # address commands that select it.
+        size = columns*pages
+        if self._spi is not None:
+            return 6 + size
+        # The address commands go out as one write and data goes out in
+        # chunks, each write paying for an address and a control byte.
+        chunk = self._i2c_chunk
+        return 2 + 6 + size + 2*((size + chunk - 1)//chunk)
+
+    def _dirty_windows(self, buf):
+        # Return the (column start, column end, page start, page end) windows
+        # that need to be sent to bring the display up to date with buf.  Pages
+        # are compared in place, without copying them.  Pages are buffer
+        # pages, a window never wraps around the end of the RAM.
+        width = self.width
+        offset = self._page_offset
+        ram = self._ram_view
+        windows = []
+        for page in range(self._pages):
+            ram_page = (page + offset) % SSD1306_RAM_PAGES
+            start = page*width
+            end = start + width
+            if not self._ram_known[ram_page]:
+                c0, c1 = 0, width - 1
+            else:
+                ram_start = ram_page*width
+                if buf.startswith(ram[ram_start:ram_start+width], start):
+                    continue
+                # Narrow down to the changed span of columns in this page.
+                delta = ram_start - start
+                first = start
+                while buf[first] == ram[first+delta]:
+                    first += 1
+                last = end - 1
+                while buf[last] == ram[last+delta]:
+                    last -= 1
+                c0 = first - start
+                c1 = last - start
+            if windows:
+                # Grow the previous window over this page if that costs less
+                # than addressing a new window.
+                w0, w1, p0, p1 = windows[-1]
+                if ram_page > (p0 + offset) % SSD1306_RAM_PAGES:
+                    m0 = min(w0, c0)
+                    m1 = max(w1, c1)
+                    merged = self._window_cost(m1-m0+1, page-p0+1)
+                    separate = self._window_cost(w1-w0+1, p1-p0+1) + \
+                               self._window_cost(c1-c0+1, 1)
+                    if merged <= separate:
+                        windows[-1] = (m0, m1, p0, page)
+                        continue
+            windows.append((c0, c1, page, page))
+        cost = sum(self._window_cost(c1-c0+1, p1-p0+1) for c0, c1, p0, p1 in windows)
+        full = self._full_windows()
+        if cost >= sum(self._window_cost(width, p1-p0+1) for _, _, p0, p1 in full):
+            return full
+        return windows
+
+    def _full_windows(self):
+        # Windows covering the whole buffer, split where it wraps around the
+        # end of the display RAM.
+        last = self.width - 1
+        wrap = SSD1306_RAM_PAGES - self._page_offset
+        if wrap >= self._pages:
+            return [(0, last, 0, self._pages-1)]
+        return [(0, last, 0, wrap-1), (0, last, wrap, self._pages-1)]
+
+    def _write_window(self, view, c0, c1, p0, p1):
+        # Send a window of columns and buffer pages from a memoryview of a frame
+        # to the RAM pages they live in.
+        ram_page = (p0 + self._page_offset) % SSD1306_RAM_PAGES
+        self.commands(SSD1306_COLUMNADDR,
+                      c0,            # Column start address.
+                      c1,            # Column end address.
+                      SSD1306_PAGEADDR,
+                      ram_page,      # Page start address.
+                      ram_page + p1 - p0)  # Page end address.
+        if c0 == 0 and c1 == self.width-1:
+            # Full width windows are contiguous in the buffer.
+            data = view[p0*self.width:(p1+1)*self.width]
+        else:
+            columns = c1 - c0 + 1
+            index = 0
+            for page in range(p0, p1+1):
+                start = page*self.width + c0
+                self._scratch_view[index:index+columns] = view[start:start+columns]
+                index += columns
+            data = self._scratch_view[:index]
+        self._write_data(data)
+
+    def _write_data(self, data):
+        # Send a run of display data bytes.
+        if self._commands:
+            self._flush_commands()
         if self._spi is not None:
             # Set DC high for data.
-            self._gpio.set_high(self._dc)
+            self._set_dc(True)
             # Write buffer.
-            self._spi.write(self._buffer)
+            self._spi.write(data)
+            if self._stats is not None:
+                self._stats.write(len(data), 0)
         else:
-            for i in range(0, len(self._buffer), 16):
-                control = 0x40   # Co = 0, DC = 0
-                self._i2c.writeList(control, self._buffer[i:i+16])
+            self._write_i2c(0x40, data)   # Co = 0, DC = 1
+
+    def _write_i2c(self, control, data):
+        # Send bytes after a control byte, with bulk messages if possible and
+        # block writes otherwise.
+        start = 0
+        if self._i2c_bulk is not None:
+            start = self._write_i2c_bulk(control, data)
+        stats = self._stats
+        for i in range(start, len(data), self._i2c_chunk):
+            self._i2c.writeList(control, data[i:i+self._i2c_chunk])
+            if stats is not None:
+                # Address and control bytes go out with every block.
+                stats.write(min(self._i2c_chunk, len(data) - i), 2)
 
-    def image(self, image):
-        """Set buffer to value of Python Imaging Library image.  The image should
-        be in 1 bit mode and a size equal to the display size.
+    def _write_i2c_bulk(self, control, data):
+        # Write bytes with bulk I2C messages and return how many were sent.  In
+        # auto mode a failed write switches to block writes for good and the
+        # caller sends the rest.
+        chunk = self._i2c_chunk
+        out = self._i2c_out_view
+        # Set through the bytearray, Python 2 memoryviews take no ints.
+        self._i2c_out[0] = control
+        for i in range(0, len(data), chunk):
+            part = data[i:i+chunk]
+            out[1:1+len(part)] = part
+            try:
+                self._i2c_bulk(out[:1+len(part)])
+            except (IOError, OSError) as ex:
+                if self._i2c_transfer != SSD1306_I2C_AUTO:
+                    raise
+                if self._stats is not None:
+                    self._stats.i2c_fallback()
+                self._log.warning('Bulk I2C write failed ({0}), falling back to '
+                                  'block writes.'.format(ex))
+                self._i2c_bulk = None
+                self._i2c_chunk = min(self._i2c_chunk_size or SSD1306_I2C_BLOCK_SIZE,
+                                      SSD1306_I2C_BLOCK_MAX)
+                return i
+            if self._stats is not None:
+                self._stats.write(len(part), 2)
+        return len(data)
+
+    def image(self, image, dither=None):
+        """Set buffer to value of Python Imaging Library image.  A 1 bit image
+        the size of the display is copied as it is.  Images in other modes,
+        like L or RGB, or of other sizes are scaled to the display size and
+        dithered to 1 bit with dither, one of SSD1306_DITHER_THRESHOLD,
+        SSD1306_DITHER_BAYER or SSD1306_DITHER_FLOYD_STEINBERG.  The default
+        is Floyd-Steinberg, like PIL's convert('1'), or a threshold for 1 bit
+        images that only need scaling.
         """
-        if image.mode != '1':
-            raise ValueError('Image must be in mode 1.')
-        imwidth, imheight = image.size
-        if imwidth != self.width or imheight != self.height:
-            raise ValueError('Image must be same dimensions as display ({0}x{1}).' \
-                .format(self.width, self.height))
-        # Grab all the pixels from the image, faster than getpixel.
-        pix = image.load()
-        # Iterate through the memory pages
-        index = 0
-        for page in range(self._pages):
-            # Iterate through all x axis columns.
-            for x in range(self.width):
-                # Set the bits for the column of pixels at the current position.
-                bits = 0
-                # Don't use range here as it's a bit slow
-                for bit in [0, 1, 2, 3, 4, 5, 6, 7]:
-                    bits = bits << 1
-                    bits |= 0 if pix[(x, page*8+7-bit)] == 0 else 1
-                # Update buffer byte and increment to next byte.
-                self._buffer[index] = bits
-                index += 1
+        stats = self._stats
+        if stats is not None:
+            start = _now()
+        direct = dither is None and image.mode == '1' and \
+                 image.size == (self.width, self.height)
+        if dither is None:
+            dither = DITHER_THRESHOLD if image.mode == '1' else DITHER_FLOYD_STEINBERG
+        # Convert whole 8 row bands at once into page bytes, or copy them from
+        # the cache if this image was converted before.  Only the cache and
+        # 1 bit images need the raw pixel bytes.
+        cache = self._image_cache
+        data = image.tobytes() if direct or cache is not None else None
+        key = None
+        pages = None
+        if cache is not None:
+            # Displays of different sizes can share the cache, and scale the
+            # same image to different sizes.
+            key = image_key(image, data) + (None if direct else dither,
+                                            self.width, self.height)
+            pages = cache.get(key)
+        if pages is None:
+            if direct:
+                pages = bytes_to_pages(data, self.width, self.height)
+            else:
+                pages = dither_to_pages(image, self.width, self.height, dither)
+            if cache is not None:
+                cache.put(key, pages)
+        self._view[:] = pages
+        if stats is not None:
+            stats.time('image', _now() - start)
+
+    def enable_image_cache(self, cache=None, max_bytes=None):
+        """Keep the results of image() conversions so showing an image that was
+        shown before only copies it into the buffer.  Images are recognized by
+        a digest of their pixels and size.  Uses cache, an ImageCache that can
+        be shared with other displays, or a new one holding up to max_bytes
+        of converted images.  Returns the ImageCache in use.
+        """
+        if cache is None:
+            cache = ImageCache() if max_bytes is None else ImageCache(max_bytes)
+        self._image_cache = cache
+        return cache
+
+    def disable_image_cache(self):
+        """Stop caching image() conversions."""
+        self._image_cache = None
+
+    @property
+    def image_cache(self):
+        """ImageCache used by image(), or None when caching is disabled."""
+        return self._image_cache
+
+    def pin_screen(self, name, image=None):
+        """Save the buffer, or a Python Imaging Library image if provided, as
+        a screen called name that screen() can bring back without converting
+        anything.  Pinned screens are kept in the image cache, which is
+        enabled if it isn't already, and are never evicted.
+        """
+        if image is not None:
+            self.image(image)
+        if self._image_cache is None:
+            self.enable_image_cache()
+        self._image_cache.pin(name, self._view)
+
+    def unpin_screen(self, name):
+        """Forget the screen called name."""
+        if self._image_cache is not None:
+            self._image_cache.unpin(name)
+
+    def screen(self, name):
+        """Copy the screen saved as name by pin_screen() into the buffer."""
+        pages = None
+        if self._image_cache is not None:
+            pages = self._image_cache.screen(name)
+        if pages is None or len(pages) != len(self._buffer):
+            raise KeyError('No screen called {0!r} is pinned.'.format(name))
+        self._view[:] = pages
 
     def clear(self):
         """Clear contents of image buffer."""
-        self._buffer = [0]*(self.width*self._pages)
+        self._view[:] = self._blank
+
+    @property
+    def buffer(self):
+        """Memoryview of the frame buffer in SSD1306 page format.  Each byte is a
+        column of 8 pixels with the topmost pixel in the least significant bit,
+        and page p of column x is at index p*width + x.
+        """
+        return self._view
 
     def set_contrast(self, contrast):
         """Sets the contrast of the display.  Contrast should be a value between
         0 and 255."""
         if contrast < 0 or contrast > 255:
             raise ValueError('Contrast must be a value from 0 to 255 (inclusive).')
-        self.command(SSD1306_SETCONTRAST)
-        self.command(contrast)
+        self.commands(SSD1306_SETCONTRAST, contrast)
+
+    def start_scroll(self, direction, start_page=0, end_page=None, interval=5,
+                     vertical_offset=0):
+        """Make the controller scroll pages start_page to end_page (inclusive,
+        default the last page) on its own, without sending any frame data.
+        Direction is SSD1306_RIGHT_HORIZONTAL_SCROLL or
+        SSD1306_LEFT_HORIZONTAL_SCROLL, and interval is the number of frames
+        between steps, one of 2, 3, 4, 5, 25, 64, 128 or 256.  A vertical_offset
+        of 1 to 63 also moves the vertical scroll area up that many rows each
+        step, see set_vertical_scroll_area.  Call stop_scroll() or display() to
+        stop scrolling, both make the next display() write the whole buffer.
+        Pages are buffer pages, and scrolling can't be used with page flipping.
+        """
+        if self._page_flip:
+            raise ValueError('Scrolling can\'t be used with page flipping.')
+        if end_page is None:
+            end_page = self._pages - 1
+        if not 0 <= start_page <= end_page <= 7:
+            raise ValueError('Scroll pages must be from 0 to 7 with start_page <= end_page.')
+        if interval not in SSD1306_SCROLL_INTERVALS:
+            raise ValueError('Scroll interval must be one of {0}.'.format(
+                sorted(SSD1306_SCROLL_INTERVALS)))
+        if not 0 <= vertical_offset <= 63:
+            raise ValueError('Vertical offset must be a value from 0 to 63 (inclusive).')
+        if direction == SSD1306_RIGHT_HORIZONTAL_SCROLL:
+            diagonal = SSD1306_VERTICAL_AND_RIGHT_HORIZONTAL_SCROLL
+        elif direction == SSD1306_LEFT_HORIZONTAL_SCROLL:
+            diagonal = SSD1306_VERTICAL_AND_LEFT_HORIZONTAL_SCROLL
+        else:
+            raise ValueError('Direction must be SSD1306_RIGHT_HORIZONTAL_SCROLL or '
+                             'SSD1306_LEFT_HORIZONTAL_SCROLL.')
+        code = SSD1306_SCROLL_INTERVALS[interval]
+        with self._lock:
+            # The controller scrolls RAM pages, buffer page p is in RAM page
+            # (p + _page_offset) % 8.  All eight pages are still 0 to 7.
+            if end_page - start_page < SSD1306_RAM_PAGES - 1:
+                start_page = (start_page + self._page_offset) % SSD1306_RAM_PAGES
+                end_page = (end_page + self._page_offset) % SSD1306_RAM_PAGES
+            if end_page < start_page:
+                raise ValueError('Scroll pages wrap around the end of display RAM '
+                                 'after ring_scroll(), scroll fewer pages.')
+            # Scrolling moves the data in display RAM around.
+            self.invalidate()
+            self._scrolling = True
+            if vertical_offset:
+                self.commands(SSD1306_DEACTIVATE_SCROLL,
+                              diagonal, 0x00, start_page, code, end_page,
+                              vertical_offset,
+                              SSD1306_ACTIVATE_SCROLL)
+            else:
+                self.commands(SSD1306_DEACTIVATE_SCROLL,
+                              direction, 0x00, start_page, code, end_page,
+                              0x00, 0xFF,
+                              SSD1306_ACTIVATE_SCROLL)
+
+    def stop_scroll(self):
+        """Stop scrolling started with start_scroll().  The display RAM has to be
+        rewritten afterwards, so the next display() writes the whole buffer.
+        """
+        with self._lock:
+            self.commands(SSD1306_DEACTIVATE_SCROLL)
+            self._scrolling = False
+            self.invalidate()
+
+    def set_vertical_scroll_area(self, fixed_rows=0, scroll_rows=None):
+        """Set the rows moved by a scroll with a vertical offset: fixed_rows rows
+        at the top stay in place and the scroll_rows rows below them (default
+        the rest of the display) scroll.
+        """
+        if scroll_rows is None:
+            scroll_rows = self.height - fixed_rows
+        if fixed_rows < 0 or scroll_rows < 0 or fixed_rows + scroll_rows > 64:
+            raise ValueError('Vertical scroll area must fit in 64 rows.')
+        self.commands(SSD1306_SET_VERTICAL_SCROLL_AREA, fixed_rows, scroll_rows)
 
     def dim(self, dim):
         """Adjusts contrast to dim the display if dim is True, otherwise sets the
@@ -235,129 +1016,36 @@ class SSD1306Base(object):
             self.set_contrast(contrast)
 
 class SSD1306_128_64(SSD1306Base):
+    profile = SSD1306_PROFILE_128_64
+
     def __init__(self, rst, dc=None, sclk=None, din=None, cs=None, gpio=None,
                  spi=None, i2c_bus=None, i2c_address=SSD1306_I2C_ADDRESS,
-                 i2c=None):
+                 i2c=None, **kwargs):
         # Call base class constructor.
         super(SSD1306_128_64, self).__init__(128, 64, rst, dc, sclk, din, cs,
-                                             gpio, spi, i2c_bus, i2c_address, i2c)
-
-    def _initialize(self):
-        # 128x64 pixel specific initialization.
-        self.command(SSD1306_DISPLAYOFF)                    # 0xAE
-        self.command(SSD1306_SETDISPLAYCLOCKDIV)            # 0xD5
-        self.command(0x80)                                  # the suggested ratio 0x80
-        self.command(SSD1306_SETMULTIPLEX)                  # 0xA8
-        self.command(0x3F)
-        self.command(SSD1306_SETDISPLAYOFFSET)              # 0xD3
-        self.command(0x0)                                   # no offset
-        self.command(SSD1306_SETSTARTLINE | 0x0)            # line #0
-        self.command(SSD1306_CHARGEPUMP)                    # 0x8D
-        if self._vccstate == SSD1306_EXTERNALVCC:
-            self.command(0x10)
-        else:
-            self.command(0x14)
-        self.command(SSD1306_MEMORYMODE)                    # 0x20
-        self.command(0x00)                                  # 0x0 act like ks0108
-        self.command(SSD1306_SEGREMAP | 0x1)
-        self.command(SSD1306_COMSCANDEC)
-        self.command(SSD1306_SETCOMPINS)                    # 0xDA
-        self.command(0x12)
-        self.command(SSD1306_SETCONTRAST)                   # 0x81
-        if self._vccstate == SSD1306_EXTERNALVCC:
-            self.command(0x9F)
-        else:
-            self.command(0xCF)
-        self.command(SSD1306_SETPRECHARGE)                  # 0xd9
-        if self._vccstate == SSD1306_EXTERNALVCC:
-            self.command(0x22)
-        else:
-            self.command(0xF1)
-        self.command(SSD1306_SETVCOMDETECT)                 # 0xDB
-        self.command(0x40)
-        self.command(SSD1306_DISPLAYALLON_RESUME)           # 0xA4
-        self.command(SSD1306_NORMALDISPLAY)                 # 0xA6
+                                             gpio, spi, i2c_bus, i2c_address, i2c,
+                                             **kwargs)
 
 
 class SSD1306_128_32(SSD1306Base):
+    profile = SSD1306_PROFILE_128_32
+
     def __init__(self, rst, dc=None, sclk=None, din=None, cs=None, gpio=None,
                  spi=None, i2c_bus=None, i2c_address=SSD1306_I2C_ADDRESS,
-                 i2c=None):
+                 i2c=None, **kwargs):
         # Call base class constructor.
         super(SSD1306_128_32, self).__init__(128, 32, rst, dc, sclk, din, cs,
-                                             gpio, spi, i2c_bus, i2c_address, i2c)
-
-    def _initialize(self):
-        # 128x32 pixel specific initialization.
-        self.command(SSD1306_DISPLAYOFF)                    # 0xAE
-        self.command(SSD1306_SETDISPLAYCLOCKDIV)            # 0xD5
-        self.command(0x80)                                  # the suggested ratio 0x80
-        self.command(SSD1306_SETMULTIPLEX)                  # 0xA8
-        self.command(0x1F)
-        self.command(SSD1306_SETDISPLAYOFFSET)              # 0xD3
-        self.command(0x0)                                   # no offset
-        self.command(SSD1306_SETSTARTLINE | 0x0)            # line #0
-        self.command(SSD1306_CHARGEPUMP)                    # 0x8D
-        if self._vccstate == SSD1306_EXTERNALVCC:
-            self.command(0x10)
-        else:
-            self.command(0x14)
-        self.command(SSD1306_MEMORYMODE)                    # 0x20
-        self.command(0x00)                                  # 0x0 act like ks0108
-        self.command(SSD1306_SEGREMAP | 0x1)
-        self.command(SSD1306_COMSCANDEC)
-        self.command(SSD1306_SETCOMPINS)                    # 0xDA
-        self.command(0x02)
-        self.command(SSD1306_SETCONTRAST)                   # 0x81
-        self.command(0x8F)
-        self.command(SSD1306_SETPRECHARGE)                  # 0xd9
-        if self._vccstate == SSD1306_EXTERNALVCC:
-            self.command(0x22)
-        else:
-            self.command(0xF1)
-        self.command(SSD1306_SETVCOMDETECT)                 # 0xDB
-        self.command(0x40)
-        self.command(SSD1306_DISPLAYALLON_RESUME)           # 0xA4
-        self.command(SSD1306_NORMALDISPLAY)                 # 0xA6
+                                             gpio, spi, i2c_bus, i2c_address, i2c,
+                                             **kwargs)
 
 
 class SSD1306_96_16(SSD1306Base):
+    profile = SSD1306_PROFILE_96_16
+
     def __init__(self, rst, dc=None, sclk=None, din=None, cs=None, gpio=None,
                  spi=None, i2c_bus=None, i2c_address=SSD1306_I2C_ADDRESS,
-                 i2c=None):
+                 i2c=None, **kwargs):
         # Call base class constructor.
         super(SSD1306_96_16, self).__init__(96, 16, rst, dc, sclk, din, cs,
-                                            gpio, spi, i2c_bus, i2c_address, i2c)
-
-    def _initialize(self):
-        # 128x32 pixel specific initialization.
-        self.command(SSD1306_DISPLAYOFF)                    # 0xAE
-        self.command(SSD1306_SETDISPLAYCLOCKDIV)            # 0xD5
-        self.command(0x60)                                  # the suggested ratio 0x60
-        self.command(SSD1306_SETMULTIPLEX)                  # 0xA8
-        self.command(0x0F)
-        self.command(SSD1306_SETDISPLAYOFFSET)              # 0xD3
-        self.command(0x0)                                   # no offset
-        self.command(SSD1306_SETSTARTLINE | 0x0)            # line #0
-        self.command(SSD1306_CHARGEPUMP)                    # 0x8D
-        if self._vccstate == SSD1306_EXTERNALVCC:
-            self.command(0x10)
-        else:
-            self.command(0x14)
-        self.command(SSD1306_MEMORYMODE)                    # 0x20
-        self.command(0x00)                                  # 0x0 act like ks0108
-        self.command(SSD1306_SEGREMAP | 0x1)
-        self.command(SSD1306_COMSCANDEC)
-        self.command(SSD1306_SETCOMPINS)                    # 0xDA
-        self.command(0x02)
-        self.command(SSD1306_SETCONTRAST)                   # 0x81
-        self.command(0x8F)
-        self.command(SSD1306_SETPRECHARGE)                  # 0xd9
-        if self._vccstate == SSD1306_EXTERNALVCC:
-            self.command(0x22)
-        else:
-            self.command(0xF1)
-        self.command(SSD1306_SETVCOMDETECT)                 # 0xDB
-        self.command(0x40)
-        self.command(SSD1306_DISPLAYALLON_RESUME)           # 0xA4
-        self.command(SSD1306_NORMALDISPLAY)                 # 0xA6
+                                            gpio, spi, i2c_bus, i2c_address, i2c,
+                                            **kwargs)
@@ -1 +1,8 @@
 from .SSD1306 import *
+from .group import DisplayGroup
+from .text import GlyphAtlas, get_atlas
+from .scheduler import FrameScheduler
+from .stats import BusStats
+from .emulator import SSD1306Emulator
+from .cache import ImageCache
+from .grayscale import TemporalGrayscale
@@ -0,0 +1,119 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import asyncio
+
+from .SSD1306 import SSD1306_SWITCHCAPVCC
+
+
+class AsyncSSD1306(object):
+    """asyncio wrapper around an SSD1306Base display.  Bus I/O and image
+    conversion run in an executor so they don't block the event loop, and
+    reset() waits with asyncio.sleep.  Attributes and methods that aren't
+    wrapped, like width, height, buffer and clear(), are passed through to the
+    display.  Requires Python 3.7 or later.
+    """
+
+    def __init__(self, display, executor=None):
+        """Wrap display, an SSD1306Base instance.  Blocking work runs in
+        executor, or the event loop's default executor if not provided.
+        """
+        self._disp = display
+        self._executor = executor
+        # Latest frame waiting to be written and the frame being written.
+        self._pending = bytearray(len(display.buffer))
+        self._sending = bytearray(len(display.buffer))
+        self._has_pending = False
+        self._waiters = []
+        self._flusher = None
+        self.coalesced_frames = 0
+
+    def __getattr__(self, name):
+        return getattr(self._disp, name)
+
+    def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, func, *args)
+
+    async def begin(self, vccstate=SSD1306_SWITCHCAPVCC, warm=False):
+        """Initialize display, or with warm take it over as it is, see
+        SSD1306Base.begin().
+        """
+        self._disp._vccstate = vccstate
+        if warm:
+            await self._run(self._disp._attach)
+            return
+        await self.reset()
+        await self._run(self._disp._setup)
+
+    async def reset(self):
+        """Reset the display."""
+        disp = self._disp
+        if disp._rst is None:
+            return
+        disp.invalidate()
+        gpio = await self._run(disp._pin, disp._rst)
+        # Set reset high for a millisecond.
+        await self._run(gpio.set_high, disp._rst)
+        await asyncio.sleep(0.001)
+        # Set reset low for 10 milliseconds.
+        await self._run(gpio.set_low, disp._rst)
+        await asyncio.sleep(0.010)
+        # Set reset high again.
+        await self._run(gpio.set_high, disp._rst)
+
+    async def image(self, image, dither=None):
+        """Set buffer to value of Python Imaging Library image, converting it
+        in the executor.  dither is passed on to SSD1306Base.image().
+        """
+        await self._run(self._disp.image, image, dither)
+
+    async def display(self):
+        """Write display buffer to physical display.  The buffer is copied when
+        called, and if other calls are made while a frame is being written only
+        the latest of their frames is written next.  Every caller returns once
+        a frame at least as new as its own is on the display.
+        """
+        loop = asyncio.get_running_loop()
+        if self._has_pending:
+            self.coalesced_frames += 1
+        self._pending[:] = self._disp.buffer
+        self._has_pending = True
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_pending())
+        await waiter
+
+    async def _flush_pending(self):
+        while self._has_pending:
+            self._pending, self._sending = self._sending, self._pending
+            self._has_pending = False
+            waiters, self._waiters = self._waiters, []
+            try:
+                await self._run(self._disp._send_frame, self._sending,
+                                memoryview(self._sending))
+            except Exception as ex:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(ex)
+                continue
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
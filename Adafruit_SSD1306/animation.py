@@ -0,0 +1,296 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Animations compiled ahead of time into SSD1306 page format, so playing them
+# needs no image decoding or conversion.  compile_animation() turns a GIF or a
+# sequence of images into a file, and AnimationPlayer maps that file into
+# memory and plays it on a display.  From the command line:
+#
+#   python -m Adafruit_SSD1306.animation boot.gif boot.ssd --size 128x64
+#
+# The file starts with a header:
+#
+#   magic 'SSDA', version (1 byte), flags (1 byte), width (2 bytes),
+#   height (2 bytes), frame count (4 bytes)
+#
+# followed by one record per frame:
+#
+#   duration in milliseconds (4 bytes), window count (2 bytes)
+#
+# and that many windows, each the first and last column and page it covers
+# (1 byte each) and then its page bytes, one run of columns per page.  The
+# first frame covers the whole display.  Later frames hold the whole display
+# too, or only the windows that changed since the frame before when the file
+# is compiled with deltas.  Numbers are little endian.
+from __future__ import division, print_function
+import argparse
+import mmap
+import os
+import struct
+import time
+
+from .convert import image_to_pages
+
+
+MAGIC = b'SSDA'
+VERSION = 1
+FLAG_DELTAS = 0x01
+
+_HEADER = struct.Struct('<4sBBHHI')
+_FRAME = struct.Struct('<IH')
+_WINDOW = struct.Struct('<BBBB')
+
+# Bytes a window costs on top of its data, in the file and to address it on
+# the display.
+_WINDOW_OVERHEAD = 6
+
+_now = getattr(time, 'monotonic', time.time)
+
+
+def _changed_windows(previous, frame, width, pages):
+    # Return (c0, c1, p0, p1) windows covering the bytes of frame that differ
+    # from previous, joining a page's span with the window above when that is
+    # smaller than starting a new window.
+    windows = []
+    for page in range(pages):
+        start = page*width
+        end = start + width
+        if frame[start:end] == previous[start:end]:
+            continue
+        first = start
+        while frame[first] == previous[first]:
+            first += 1
+        last = end - 1
+        while frame[last] == previous[last]:
+            last -= 1
+        c0, c1 = first - start, last - start
+        if windows and windows[-1][3] == page - 1:
+            w0, w1, p0, p1 = windows[-1]
+            m0, m1 = min(w0, c0), max(w1, c1)
+            merged = (m1 - m0 + 1)*(page - p0 + 1)
+            separate = (w1 - w0 + 1)*(p1 - p0 + 1) + (c1 - c0 + 1) + _WINDOW_OVERHEAD
+            if merged <= separate:
+                windows[-1] = (m0, m1, p0, page)
+                continue
+        windows.append((c0, c1, page, page))
+    return windows
+
+
+def _window_data(frame, width, c0, c1, p0, p1):
+    data = bytearray()
+    for page in range(p0, p1 + 1):
+        data += frame[page*width + c0:page*width + c1 + 1]
+    return data
+
+
+def _frames(source, duration):
+    # Yield (image, duration in milliseconds) for a GIF or image file path, an
+    # image with several frames, or a sequence of images and paths.
+    from PIL import Image, ImageSequence
+    if isinstance(source, str):
+        source = Image.open(source)
+    if hasattr(source, 'seek'):
+        for frame in ImageSequence.Iterator(source):
+            yield frame.copy(), frame.info.get('duration', duration)
+        return
+    for image in source:
+        if isinstance(image, str):
+            image = Image.open(image)
+        yield image, image.info.get('duration', duration)
+
+
+def compile_animation(source, path, width, height, deltas=True, duration=100):
+    """Compile an animation for a width x height display into a file at path.
+    source can be the path of a GIF or other image file, a PIL image with
+    several frames, or a sequence of PIL images or image paths.  Frames are
+    converted to 1 bit and must be the display size.  Frames without their
+    own duration are shown for duration milliseconds.  With deltas, frames
+    after the first only store the windows that changed.  Returns the number
+    of frames written.
+    """
+    pages = height//8
+    full = [(0, width - 1, 0, pages - 1)]
+    previous = None
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, FLAG_DELTAS if deltas else 0,
+                             width, height, 0))
+        for image, frame_duration in _frames(source, duration):
+            if image.mode != '1':
+                image = image.convert('1')
+            if image.size != (width, height):
+                raise ValueError('Frame {0} is {1}x{2}, not the display size '
+                                 '{3}x{4}.'.format(count, image.size[0],
+                                                   image.size[1], width, height))
+            frame = image_to_pages(image, width, height)
+            windows = full
+            if deltas and previous is not None:
+                windows = _changed_windows(previous, frame, width, pages)
+            f.write(_FRAME.pack(int(frame_duration), len(windows)))
+            for c0, c1, p0, p1 in windows:
+                f.write(_WINDOW.pack(c0, c1, p0, p1))
+                f.write(_window_data(frame, width, c0, c1, p0, p1))
+            previous = frame
+            count += 1
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, FLAG_DELTAS if deltas else 0,
+                             width, height, count))
+    if count == 0:
+        os.remove(path)
+        raise ValueError('Animation source has no frames.')
+    return count
+
+
+class AnimationPlayer(object):
+    """Plays an animation file made by compile_animation() on a display.  The
+    file is mapped into memory and each frame's windows are copied from it
+    into the display buffer, then written with display(), so only what
+    changed goes over the bus and the buffer always holds the frame shown.
+    Nothing is decoded while playing and PIL is not needed.
+    """
+
+    def __init__(self, display, path):
+        """Open the animation at path for display, which must be the size the
+        animation was compiled for.
+        """
+        self._display = display
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        magic, version, flags, width, height, count = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError('{0} is not an SSD1306 animation.'.format(path))
+        if count == 0:
+            self.close()
+            raise ValueError('{0} has no frames.'.format(path))
+        if width != display.width or height != display.height:
+            self.close()
+            raise ValueError('Animation is {0}x{1}, not the display size {2}x{3}.'
+                             .format(width, height, display.width, display.height))
+        self.deltas = bool(flags & FLAG_DELTAS)
+        # Index the frames as (duration in seconds, [(c0, c1, p0, p1, offset)]).
+        self._frames = []
+        offset = _HEADER.size
+        for _ in range(count):
+            duration, windows = _FRAME.unpack_from(self._map, offset)
+            offset += _FRAME.size
+            frame = []
+            for _ in range(windows):
+                c0, c1, p0, p1 = _WINDOW.unpack_from(self._map, offset)
+                offset += _WINDOW.size
+                frame.append((c0, c1, p0, p1, offset))
+                offset += (c1 - c0 + 1)*(p1 - p0 + 1)
+            self._frames.append((duration/1000.0, frame))
+        self._current = None
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def durations(self):
+        """List of the time each frame is shown for, in seconds."""
+        return [duration for duration, _ in self._frames]
+
+    def show(self, index):
+        """Show frame index now.  With a delta animation the display must be
+        showing the frame before it, or the first frame is shown again.
+        """
+        if self.deltas and index not in (0, self._next_index()):
+            for i in range(index + 1):
+                self._apply(i)
+        else:
+            self._apply(index)
+        self._display.display()
+        self._current = index
+
+    def play(self, loops=1):
+        """Play the animation loops times, or forever if loops is 0, keeping
+        to the frame durations.  Frames are dropped if writing them falls
+        behind the schedule.
+        """
+        played = 0
+        deadline = _now()
+        while loops == 0 or played < loops:
+            index = 0
+            while index < len(self._frames):
+                self.show(index)
+                deadline += self._frames[index][0]
+                index += 1
+                remaining = deadline - _now()
+                if remaining > 0:
+                    time.sleep(remaining)
+                    continue
+                # Skip frames whose time has passed, a delta frame still has to
+                # be applied to the buffer but isn't written.
+                while index < len(self._frames) - 1 and \
+                      deadline + self._frames[index][0] < _now():
+                    if self.deltas:
+                        self._apply(index)
+                        self._current = index
+                    deadline += self._frames[index][0]
+                    index += 1
+            played += 1
+
+    def close(self):
+        """Unmap the animation file."""
+        self._view.release()
+        self._map.close()
+
+    def _next_index(self):
+        if self._current is None:
+            return 0
+        return (self._current + 1) % len(self._frames)
+
+    def _apply(self, index):
+        # Copy the windows of a frame into the display buffer.
+        buf = self._display.buffer
+        width = self._display.width
+        view = self._view
+        for c0, c1, p0, p1, offset in self._frames[index][1]:
+            columns = c1 - c0 + 1
+            for page in range(p0, p1 + 1):
+                start = page*width + c0
+                buf[start:start+columns] = view[offset:offset+columns]
+                offset += columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile a GIF or images into '
+                                     'an SSD1306 animation file.')
+    parser.add_argument('input', nargs='+', help='GIF, or image files in order.')
+    parser.add_argument('output', help='Animation file to write.')
+    parser.add_argument('--size', default='128x64',
+                        help='Display size as WIDTHxHEIGHT.')
+    parser.add_argument('--duration', type=int, default=100,
+                        help='Milliseconds per frame for frames without one.')
+    parser.add_argument('--no-deltas', action='store_true',
+                        help='Store every frame in full.')
+    args = parser.parse_args()
+    width, height = (int(value) for value in args.size.split('x'))
+    source = args.input[0] if len(args.input) == 1 else args.input
+    count = compile_animation(source, args.output, width, height,
+                              deltas=not args.no_deltas, duration=args.duration)
+    print('Wrote {0} frames, {1} bytes.'.format(count, os.path.getsize(args.output)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import collections
+import hashlib
+import threading
+
+
+# Default byte budget, room for 64 frames of a 128x64 display.
+DEFAULT_CACHE_BYTES = 64*1024
+
+
+def image_key(image, data):
+    """Return the cache key of a PIL image whose tobytes() is data."""
+    return (image.mode, image.size, hashlib.sha1(data).digest())
+
+
+class ImageCache(object):
+    """Cache of images already converted to the SSD1306 page format, enabled on
+    a display with enable_image_cache().  Conversions are kept in least
+    recently used order and the oldest are dropped once they take more than
+    max_bytes.  Screens pinned by name are kept apart from that and are never
+    dropped.  One cache can be shared by displays, keys include image sizes.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        """Create an empty cache holding up to max_bytes of converted images."""
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._screens = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the pages stored for key and mark them as recently used, or
+        None if they are not in the cache.
+        """
+        with self._lock:
+            pages = self._entries.get(key)
+            if pages is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # Move the entry to the recently used end.
+            del self._entries[key]
+            self._entries[key] = pages
+            return pages
+
+    def put(self, key, pages):
+        """Store pages for key, dropping the least recently used entries to
+        stay within the byte budget.
+        """
+        pages = bytes(pages)
+        if len(pages) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old)
+            self._entries[key] = pages
+            self.bytes += len(pages)
+            while self.bytes > self.max_bytes:
+                _, dropped = self._entries.popitem(last=False)
+                self.bytes -= len(dropped)
+                self.evictions += 1
+
+    def pin(self, name, pages):
+        """Keep pages as the screen called name until unpin() is called."""
+        with self._lock:
+            self._screens[name] = bytes(pages)
+
+    def unpin(self, name):
+        """Forget the screen called name."""
+        with self._lock:
+            self._screens.pop(name, None)
+
+    def screen(self, name):
+        """Return the pages of the screen called name, or None."""
+        with self._lock:
+            return self._screens.get(name)
+
+    def clear(self):
+        """Drop every cached conversion.  Pinned screens are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def snapshot(self):
+        """Return a dict of the cache counters and size."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'entries': len(self._entries),
+                    'bytes': self.bytes, 'max_bytes': self.max_bytes,
+                    'screens': len(self._screens)}
@@ -0,0 +1,242 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from __future__ import division
+import struct
+
+# NumPy is optional, the pure Python path below is used when it is missing.
+# It takes a while to import, so that waits for the first conversion.
+np = None
+_numpy_checked = False
+
+
+def _numpy():
+    # Import NumPy on first use and return it, or None if it is missing.
+    global np, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            pass
+        _numpy_checked = True
+    return np
+
+
+def _spread(value):
+    # Move bit 7-c of value to bit 0 of byte c in a little endian 64-bit word.
+    # This turns one packed row byte (leftmost pixel in the MSB) into eight
+    # column bytes that each hold that row's pixel in their low bit.
+    word = 0
+    for c in range(8):
+        if value & (0x80 >> c):
+            word |= 1 << (8*c)
+    return word
+
+# One table per row of an 8 row band, pre-shifted so that the row's pixel ends
+# up in the right bit of each column byte.  Or-ing the entries of all eight rows
+# together transposes an 8x8 block of pixels into 8 page bytes.  Built the first
+# time the pure Python path runs.
+_TRANSPOSE = None
+
+
+def image_to_pages(image, width, height):
+    """Convert a 1 bit Python Imaging Library image into the SSD1306 page
+    format and return it as a bytearray of width*(height//8) bytes.  Each byte
+    holds a column of 8 pixels with the topmost pixel in the least significant
+    bit.  The image must be in mode 1 and exactly width x height pixels.
+    """
+    return bytes_to_pages(image.tobytes(), width, height)
+
+
+def bytes_to_pages(data, width, height):
+    """Convert the tobytes() data of a 1 bit width x height image into the
+    SSD1306 page format, like image_to_pages.
+    """
+    if _numpy() is not None:
+        return _pages_numpy(data, width, height)
+    return _pages_python(data, width, height)
+
+
+def _pages_python(data, width, height):
+    global _TRANSPOSE
+    if _TRANSPOSE is None:
+        _TRANSPOSE = [[_spread(v) << row for v in range(256)] for row in range(8)]
+    data = bytearray(data)
+    stride = (width + 7)//8
+    pages = height//8
+    band = 8*stride
+    pack = struct.Struct('<{0}Q'.format(stride)).pack
+    t0, t1, t2, t3, t4, t5, t6, t7 = _TRANSPOSE
+    result = bytearray(width*pages)
+    for page in range(pages):
+        start = page*band
+        rows = [data[start+r*stride:start+(r+1)*stride] for r in range(8)]
+        words = [t0[a] | t1[b] | t2[c] | t3[d] | t4[e] | t5[f] | t6[g] | t7[h]
+                 for a, b, c, d, e, f, g, h in zip(*rows)]
+        result[page*width:(page+1)*width] = pack(*words)[:width]
+    return result
+
+
+def _pages_numpy(data, width, height):
+    stride = (width + 7)//8
+    pages = height//8
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(height, stride)
+    bits = np.unpackbits(rows, axis=1)[:, :width].reshape(pages, 8, width)
+    # packbits puts the first element in the MSB, so flip each band to get
+    # the topmost row into bit 0.
+    packed = np.packbits(bits[:, ::-1, :], axis=1)
+    return bytearray(packed.tobytes())
+
+
+# Dithering methods for dither_to_pages.
+DITHER_THRESHOLD = 'threshold'
+DITHER_BAYER = 'bayer'
+DITHER_FLOYD_STEINBERG = 'floyd-steinberg'
+
+
+def _bayer(size):
+    # Return a size x size ordered dither index matrix, size a power of 2.
+    matrix = [[0]]
+    while len(matrix) < size:
+        n = len(matrix)
+        matrix = [[4*matrix[y % n][x % n] + [0, 2, 3, 1][(y//n)*2 + x//n]
+                   for x in range(2*n)] for y in range(2*n)]
+    return matrix
+
+# Gray level each pixel of an 8x8 tile must be above to be turned on, spread
+# evenly between 2 and 254.
+_BAYER_THRESHOLDS = [[4*v + 2 for v in row] for row in _bayer(8)]
+
+# bytes.translate tables for the pure Python path, built on first use.
+_tables = {}
+
+
+def _table(key, test):
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = bytes(bytearray(1 if test(v) else 0 for v in range(256)))
+    return table
+
+
+def dither_to_pages(image, width, height, method=DITHER_FLOYD_STEINBERG,
+                    threshold=128):
+    """Scale a Python Imaging Library image of any mode and size to width x
+    height, dither it to 1 bit and return it in the SSD1306 page format like
+    image_to_pages.  method is DITHER_THRESHOLD, which turns on pixels at
+    least as bright as threshold, DITHER_BAYER for an 8x8 ordered dither or
+    DITHER_FLOYD_STEINBERG for error diffusion.  Pixels go straight from gray
+    levels into page bytes, no 1 bit image is made.
+    """
+    if method not in (DITHER_THRESHOLD, DITHER_BAYER, DITHER_FLOYD_STEINBERG):
+        raise ValueError('Unknown dither method {0}.'.format(method))
+    from PIL import Image
+    if image.mode != 'L':
+        image = image.convert('L')
+    if image.size != (width, height):
+        image = image.resize((width, height), Image.BILINEAR)
+    if method == DITHER_FLOYD_STEINBERG:
+        bits = _error_diffusion(image)
+        if _numpy() is not None:
+            return _pack_numpy(np.frombuffer(bits, dtype=np.uint8), width, height)
+        return _pack_python(bits, width, height)
+    data = image.tobytes()
+    if _numpy() is not None:
+        gray = np.frombuffer(data, dtype=np.uint8).reshape(height, width)
+        if method == DITHER_THRESHOLD:
+            bits = gray >= threshold
+        else:
+            tile = np.array(_BAYER_THRESHOLDS, dtype=np.uint8)
+            tiles = np.tile(tile, ((height + 7)//8, (width + 7)//8))
+            bits = gray > tiles[:height, :width]
+        return _pack_numpy(bits, width, height)
+    data = bytes(data)
+    if method == DITHER_THRESHOLD:
+        bits = data.translate(_table(('threshold', threshold), lambda v: v >= threshold))
+    else:
+        # Every eighth pixel of a row shares a threshold, so each row takes
+        # eight translate calls.
+        bits = bytearray(width*height)
+        for y in range(height):
+            row = y*width
+            for phase in range(min(8, width)):
+                limit = _BAYER_THRESHOLDS[y & 7][phase]
+                table = _table(('bayer', limit), lambda v: v > limit)
+                bits[row+phase:row+width:8] = data[row+phase:row+width:8].translate(table)
+    return _pack_python(bits, width, height)
+
+
+def _pack_numpy(bits, width, height):
+    # Pack one 0 or 1 value per pixel into page bytes, the same way as
+    # _pages_numpy with each band flipped so the topmost row lands in bit 0.
+    bands = bits.reshape(height//8, 8, width)
+    return bytearray(np.packbits(bands[:, ::-1, :], axis=1).tobytes())
+
+
+def _pack_python(bits, width, height):
+    # Pack one 0 or 1 value per pixel into page bytes.
+    bits = bytearray(bits)
+    result = bytearray(width*(height//8))
+    for page in range(height//8):
+        rows = [bits[(page*8+r)*width:(page*8+r+1)*width] for r in range(8)]
+        result[page*width:(page+1)*width] = bytearray(
+            a | b << 1 | c << 2 | d << 3 | e << 4 | f << 5 | g << 6 | h << 7
+            for a, b, c, d, e, f, g, h in zip(*rows))
+    return result
+
+
+# Black and white palette image for PIL's quantize, built on first use.
+_palette = None
+
+
+def _error_diffusion(image):
+    # Floyd-Steinberg dither an L image into bytes of 0 and 1 values.  PIL's
+    # quantize to a black and white palette does this in C and gives palette
+    # indices, which are those values.  Pillow versions that can't quantize L
+    # images to a palette fall back to doing it here.
+    global _palette
+    from PIL import Image
+    if _palette is None:
+        _palette = Image.new('P', (1, 1))
+        _palette.putpalette([0, 0, 0, 255, 255, 255] + [0]*762)
+    dither = getattr(Image, 'Dither', Image).FLOYDSTEINBERG
+    try:
+        return image.convert('RGB').quantize(palette=_palette, dither=dither).tobytes()
+    except (TypeError, ValueError):
+        pass
+    width, height = image.size
+    data = bytearray(image.tobytes())
+    bits = bytearray(width*height)
+    # Errors are kept in sixteenths.
+    below = [0]*(width + 2)
+    for y in range(height):
+        errors, below = below, [0]*(width + 2)
+        row = y*width
+        for x in range(width):
+            value = data[row+x] + errors[x+1]//16
+            if value >= 128:
+                bits[row+x] = 1
+                error = value - 255
+            else:
+                error = value
+            errors[x+2] += error*7
+            below[x] += error*3
+            below[x+1] += error*5
+            below[x+2] += error
+    return bits
@@ -0,0 +1,362 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from __future__ import division
+
+
+# Size of the controller's display RAM, whatever the size of the panel.
+RAM_COLUMNS = 128
+RAM_PAGES = 8
+
+# Addressing modes set by the MEMORYMODE command.
+HORIZONTAL = 0
+VERTICAL = 1
+PAGE = 2
+
+# Number of argument bytes that follow each multi byte command.
+_ARGUMENTS = {
+    0x20: 1,    # Memory addressing mode.
+    0x21: 2,    # Column address range.
+    0x22: 2,    # Page address range.
+    0x26: 6,    # Right horizontal scroll setup.
+    0x27: 6,    # Left horizontal scroll setup.
+    0x29: 5,    # Vertical and right horizontal scroll setup.
+    0x2A: 5,    # Vertical and left horizontal scroll setup.
+    0x81: 1,    # Contrast.
+    0x8D: 1,    # Charge pump.
+    0xA3: 2,    # Vertical scroll area.
+    0xA8: 1,    # Multiplex ratio.
+    0xD3: 1,    # Display offset.
+    0xD5: 1,    # Display clock divide.
+    0xD9: 1,    # Precharge period.
+    0xDA: 1,    # COM pins configuration.
+    0xDB: 1,    # VCOMH deselect level.
+}
+
+
+class SSD1306Emulator(object):
+    """In-memory model of an SSD1306 controller and its panel, for running the
+    library without hardware.  Pass the emulator as the i2c provider, or as
+    both the spi device and gpio adapter, of a display class:
+
+      emulator = SSD1306Emulator(128, 32, dc=24, rst=25)
+      disp = SSD1306_128_32(rst=25, dc=24, spi=emulator, gpio=emulator)
+
+    The command stream is decoded into controller state and the 128x64 pixel
+    display RAM, including the addressing modes, segment remap, COM scan
+    direction, start line, display offset, inversion and scrolling.  image()
+    and ascii() show what the panel would display, and frame_cost() reports
+    the bus traffic since it was last called.
+
+    The panel is drawn as Adafruit modules are wired, so an image is upright
+    when the segment remap and COM scan decrement are both on, like the
+    library's initialization sets them.  Hardware scrolling has no clock here,
+    call scroll_step() to advance it.
+    """
+
+    def __init__(self, width=128, height=64, dc=None, rst=None):
+        """Create an emulator for a width by height panel.  When it is used for
+        SPI, dc and rst are the pins the display class drives as DC and reset.
+        If dc is not given any pin other than rst is taken as DC.
+        """
+        self.width = width
+        self.height = height
+        self._dc = dc
+        self._rst = rst
+        self._dc_high = False
+        self.ram = bytearray(RAM_COLUMNS*RAM_PAGES)
+        self.address = None
+        self.clock_hz = None
+        self._cost = {}
+        self.frame_cost()
+        self.reset()
+
+    def reset(self):
+        """Put the controller registers in their power on state.  Like the real
+        controller, display RAM is left as it was.
+        """
+        self.memory_mode = PAGE
+        self.column_range = (0, RAM_COLUMNS - 1)
+        self.page_range = (0, RAM_PAGES - 1)
+        self.column = 0
+        self.page = 0
+        self.start_line = 0
+        self.display_offset = 0
+        self.multiplex = 63
+        self.segment_remap = False
+        self.com_scan_decrement = False
+        self.inverted = False
+        self.entire_on = False
+        self.display_on = False
+        self.contrast = 0x7F
+        self.charge_pump = False
+        # Scrolling setup, (command, arguments) of the last setup command.
+        self.scroll_setup = None
+        self.scrolling = False
+        self.scroll_area = (0, 64)
+        self._vertical_scroll = 0
+        self._pending = []
+
+    # I2C provider and device interface.
+
+    def get_i2c_device(self, address, **kwargs):
+        """Return the I2C device of the emulated controller."""
+        self.address = address
+        return _EmulatorI2CDevice(self, address)
+
+    # SPI device interface.
+
+    def set_clock_hz(self, hz):
+        self.clock_hz = hz
+
+    def write(self, data):
+        """Take an SPI transfer, as commands or data depending on the DC pin."""
+        data = bytearray(data)
+        self._count(len(data), 0)
+        if self._dc_high:
+            self._write_data(data)
+        else:
+            self._write_commands(data)
+
+    # GPIO adapter interface.
+
+    def setup(self, pin, mode, pull_up_down=None):
+        pass
+
+    def output(self, pin, value):
+        if value:
+            self.set_high(pin)
+        else:
+            self.set_low(pin)
+
+    def set_high(self, pin):
+        if pin == self._rst:
+            return
+        if self._dc is None or pin == self._dc:
+            if not self._dc_high:
+                self._cost['dc_toggles'] += 1
+            self._dc_high = True
+
+    def set_low(self, pin):
+        if pin == self._rst:
+            self.reset()
+        elif self._dc is None or pin == self._dc:
+            if self._dc_high:
+                self._cost['dc_toggles'] += 1
+            self._dc_high = False
+
+    # Bus accounting.
+
+    def frame_cost(self):
+        """Return a dict with the bus transactions, bytes on the wire (with I2C
+        address and control bytes), command bytes, data bytes and DC pin
+        changes since the last call, and start counting again.
+        """
+        cost = self._cost
+        self._cost = {'transactions': 0, 'bytes': 0, 'command_bytes': 0,
+                      'data_bytes': 0, 'dc_toggles': 0}
+        return cost
+
+    def _count(self, payload, overhead):
+        self._cost['transactions'] += 1
+        self._cost['bytes'] += payload + overhead
+
+    def _i2c_message(self, data):
+        # Decode an I2C message after the address: control bytes with Co set
+        # are followed by one byte, without Co the rest of the message is all
+        # commands or all data.
+        self._count(len(data), 1)
+        i = 0
+        while i < len(data):
+            control = data[i]
+            if control & 0x80:
+                part = data[i+1:i+2]
+                i += 2
+            else:
+                part = data[i+1:]
+                i = len(data)
+            if control & 0x40:
+                self._write_data(part)
+            else:
+                self._write_commands(part)
+
+    # Command decoding.
+
+    def _write_commands(self, data):
+        self._cost['command_bytes'] += len(data)
+        for byte in data:
+            self._pending.append(byte)
+            needed = _ARGUMENTS.get(self._pending[0], 0)
+            if len(self._pending) > needed:
+                command = self._pending
+                self._pending = []
+                self._command(command[0], command[1:])
+
+    def _command(self, c, args):
+        if c == 0x20:
+            self.memory_mode = args[0] & 0x03
+        elif c == 0x21:
+            self.column_range = (args[0] & 0x7F, args[1] & 0x7F)
+            self.column = self.column_range[0]
+        elif c == 0x22:
+            self.page_range = (args[0] & 0x07, args[1] & 0x07)
+            self.page = self.page_range[0]
+        elif c < 0x10:
+            self.column = (self.column & 0xF0) | c
+        elif c < 0x20:
+            self.column = (self.column & 0x0F) | ((c & 0x07) << 4)
+        elif c in (0x26, 0x27, 0x29, 0x2A):
+            self.scroll_setup = (c, tuple(args))
+        elif c == 0x2E:
+            self.scrolling = False
+        elif c == 0x2F:
+            self.scrolling = self.scroll_setup is not None
+            self._vertical_scroll = 0
+        elif 0x40 <= c < 0x80:
+            self.start_line = c & 0x3F
+        elif c == 0x81:
+            self.contrast = args[0]
+        elif c == 0x8D:
+            self.charge_pump = bool(args[0] & 0x04)
+        elif c in (0xA0, 0xA1):
+            self.segment_remap = c == 0xA1
+        elif c == 0xA3:
+            self.scroll_area = (args[0] & 0x3F, args[1] & 0x7F)
+        elif c in (0xA4, 0xA5):
+            self.entire_on = c == 0xA5
+        elif c in (0xA6, 0xA7):
+            self.inverted = c == 0xA7
+        elif c == 0xA8:
+            self.multiplex = args[0] & 0x3F
+        elif c in (0xAE, 0xAF):
+            self.display_on = c == 0xAF
+        elif 0xB0 <= c < 0xB8:
+            self.page = c & 0x07
+        elif c in (0xC0, 0xC8):
+            self.com_scan_decrement = c == 0xC8
+        elif c == 0xD3:
+            self.display_offset = args[0] & 0x3F
+        # Timing, charge and NOP commands don't change the picture.
+
+    def _write_data(self, data):
+        # Write display data at the address pointer, moving it the way the
+        # addressing mode does.
+        self._cost['data_bytes'] += len(data)
+        ram = self.ram
+        c0, c1 = self.column_range
+        p0, p1 = self.page_range
+        for byte in data:
+            ram[self.page*RAM_COLUMNS + self.column] = byte
+            if self.memory_mode == HORIZONTAL:
+                if self.column >= c1:
+                    self.column = c0
+                    self.page = p0 if self.page >= p1 else self.page + 1
+                else:
+                    self.column += 1
+            elif self.memory_mode == VERTICAL:
+                if self.page >= p1:
+                    self.page = p0
+                    self.column = c0 if self.column >= c1 else self.column + 1
+                else:
+                    self.page += 1
+            else:
+                self.column = (self.column + 1) % RAM_COLUMNS
+
+    # Scrolling.
+
+    def scroll_step(self, steps=1):
+        """Advance an active hardware scroll by steps scroll steps."""
+        if not self.scrolling:
+            return
+        c, args = self.scroll_setup
+        start_page = args[1] & 0x07
+        end_page = args[3] & 0x07
+        left = c in (0x27, 0x2A)
+        for _ in range(steps):
+            for page in range(start_page, end_page + 1):
+                row = self.ram[page*RAM_COLUMNS:(page+1)*RAM_COLUMNS]
+                if left:
+                    row = row[1:] + row[:1]
+                else:
+                    row = row[-1:] + row[:-1]
+                self.ram[page*RAM_COLUMNS:(page+1)*RAM_COLUMNS] = row
+            if c in (0x29, 0x2A):
+                self._vertical_scroll += args[4] & 0x3F
+
+    # Rendering.
+
+    def ram_pixel(self, column, row):
+        """Return 1 if the display RAM bit at column and row is set."""
+        return (self.ram[(row//8)*RAM_COLUMNS + column] >> (row & 7)) & 1
+
+    def glass(self):
+        """Return what the panel shows as a list of rows of 0 and 1 values."""
+        rows = []
+        lines = self.multiplex + 1
+        fixed, scrolled = self.scroll_area
+        for y in range(self.height):
+            if not self.display_on or y >= lines:
+                rows.append([0]*self.width)
+                continue
+            if self.entire_on:
+                rows.append([1]*self.width)
+                continue
+            com = lines - 1 - y if not self.com_scan_decrement else y
+            line = com + self.start_line + self.display_offset
+            if self.scrolling and self._vertical_scroll and scrolled and \
+               fixed <= com < fixed + scrolled:
+                line = fixed + (com - fixed + self._vertical_scroll) % scrolled + \
+                       self.start_line + self.display_offset
+            line %= RAM_PAGES*8
+            row = []
+            for x in range(self.width):
+                column = x if self.segment_remap else self.width - 1 - x
+                row.append(self.ram_pixel(column, line) ^ self.inverted)
+            rows.append(row)
+        return rows
+
+    def image(self):
+        """Return what the panel shows as a 1 bit Python Imaging Library image."""
+        from PIL import Image
+        img = Image.new('1', (self.width, self.height))
+        img.putdata([255 if value else 0 for row in self.glass() for value in row])
+        return img
+
+    def ascii(self, on='#', off='.'):
+        """Return what the panel shows as text, one line per row."""
+        return '\n'.join(''.join(on if value else off for value in row)
+                         for row in self.glass())
+
+
+class _EmulatorI2CDevice(object):
+    # I2C device of an emulator, with the Adafruit_GPIO I2C device methods the
+    # display classes use and writeBytes for bulk messages.
+
+    def __init__(self, emulator, address):
+        self._emulator = emulator
+        self._address = address
+
+    def write8(self, register, value):
+        self._emulator._i2c_message(bytearray([register, value & 0xFF]))
+
+    def writeList(self, register, data):
+        self._emulator._i2c_message(bytearray([register]) + bytearray(data))
+
+    def writeBytes(self, data):
+        self._emulator._i2c_message(bytearray(data))
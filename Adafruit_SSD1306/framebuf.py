@@ -0,0 +1,267 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from __future__ import division
+
+from .text import get_atlas
+
+
+# Bytes to overwrite whole runs of columns, longer than any SSD1306 is wide.
+_ONES = memoryview(b'\xff'*256)
+_ZEROS = memoryview(b'\x00'*256)
+
+# bytearray.translate tables that set, clear or invert the bits of a mask in
+# every byte they are applied to, built on first use.
+_SET = 1
+_CLEAR = 0
+_INVERT = -1
+_tables = {}
+
+
+def _table(op, mask):
+    key = (op, mask)
+    table = _tables.get(key)
+    if table is None:
+        if op == _SET:
+            values = [v | mask for v in range(256)]
+        elif op == _CLEAR:
+            values = [v & ~mask for v in range(256)]
+        else:
+            values = [v ^ mask for v in range(256)]
+        table = _tables[key] = bytes(bytearray(values))
+    return table
+
+
+class PageBuffer(object):
+    """Drawing primitives that work directly on a frame buffer in SSD1306 page
+    format, without going through the Python Imaging Library.  Classes using
+    this mixin provide width, height, _pages and _buffer, a bytearray (or
+    memoryview) where byte p*width + x holds the 8 pixels of page p in column
+    x with the topmost pixel in the least significant bit.
+
+    Drawing is clipped to the buffer.  A color of 0 turns pixels off and any
+    other value turns them on.  Changes are picked up by the next display()
+    like any other change to the buffer.
+    """
+
+    def pixel(self, x, y, color=1):
+        """Set the pixel at x, y."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            index = (y//8)*self.width + x
+            if color:
+                self._buffer[index] |= 1 << (y & 7)
+            else:
+                self._buffer[index] &= ~(1 << (y & 7)) & 0xFF
+
+    def get_pixel(self, x, y):
+        """Return 1 if the pixel at x, y is on and 0 otherwise."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return (self._buffer[(y//8)*self.width + x] >> (y & 7)) & 1
+        return 0
+
+    def hline(self, x, y, width, color=1):
+        """Draw a horizontal line width pixels long starting at x, y."""
+        self.fill_rect(x, y, width, 1, color)
+
+    def vline(self, x, y, height, color=1):
+        """Draw a vertical line height pixels long starting at x, y."""
+        self.fill_rect(x, y, 1, height, color)
+
+    def fill_rect(self, x, y, width, height, color=1):
+        """Fill a rectangle with its top left corner at x, y."""
+        self._fill(x, y, width, height, _SET if color else _CLEAR)
+
+    def invert_rect(self, x, y, width, height):
+        """Invert every pixel of a rectangle with its top left corner at x, y."""
+        self._fill(x, y, width, height, _INVERT)
+
+    def rect(self, x, y, width, height, color=1):
+        """Draw the outline of a rectangle with its top left corner at x, y."""
+        if width <= 0 or height <= 0:
+            return
+        self.fill_rect(x, y, width, 1, color)
+        self.fill_rect(x, y+height-1, width, 1, color)
+        self.fill_rect(x, y, 1, height, color)
+        self.fill_rect(x+width-1, y, 1, height, color)
+
+    def line(self, x0, y0, x1, y1, color=1):
+        """Draw a line from x0, y0 to x1, y1 inclusive."""
+        if y0 == y1:
+            self.hline(min(x0, x1), y0, abs(x1-x0)+1, color)
+            return
+        if x0 == x1:
+            self.vline(x0, min(y0, y1), abs(y1-y0)+1, color)
+            return
+        # Bresenham's algorithm.
+        dx = abs(x1-x0)
+        dy = -abs(y1-y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        error = dx + dy
+        pixel = self.pixel
+        while True:
+            pixel(x0, y0, color)
+            if x0 == x1 and y0 == y1:
+                return
+            e2 = 2*error
+            if e2 >= dy:
+                error += dy
+                x0 += sx
+            if e2 <= dx:
+                error += dx
+                y0 += sy
+
+    def blit(self, x, y, data, width, height):
+        """Copy a bitmap into the buffer with its top left corner at x, y.  The
+        bitmap must be in the same page format as the buffer: width bytes for
+        each 8 rows, with the topmost row of each 8 in the least significant
+        bit.  Every pixel of the bitmap is copied, including the ones that are
+        off.  Bitmaps drawn at a y that is a multiple of 8 are copied a page
+        at a time, others are shifted into place.
+        """
+        # Clip the columns to the buffer.
+        left = max(0, -x)
+        right = min(width, self.width - x)
+        if left >= right or y >= self.height or y + height <= 0:
+            return
+        buf = self._buffer
+        columns = right - left
+        shift = y & 7
+        for page in range((height + 7)//8):
+            # Rows of this bitmap page that belong to the bitmap.
+            rows = min(8, height - page*8)
+            mask = 0xFF >> (8 - rows)
+            src = page*width + left
+            top = y + page*8
+            dest_page = top >> 3
+            if shift == 0 and mask == 0xFF:
+                if 0 <= dest_page < self._pages:
+                    start = dest_page*self.width + x + left
+                    buf[start:start+columns] = data[src:src+columns]
+                continue
+            # The page straddles two buffer pages, or only some of its rows
+            # are used: shift the bits into place and merge them in.
+            for part, bits in ((dest_page, shift), (dest_page + 1, shift - 8)):
+                if not 0 <= part < self._pages:
+                    continue
+                part_mask = (mask << bits if bits >= 0 else mask >> -bits) & 0xFF
+                if not part_mask:
+                    continue
+                start = part*self.width + x + left
+                for i in range(columns):
+                    value = data[src+i]
+                    value = (value << bits if bits >= 0 else value >> -bits) & part_mask
+                    buf[start+i] = (buf[start+i] & ~part_mask) | value
+
+    def draw_text(self, x, y, text, atlas=None):
+        """Draw text with its top left corner at x, y using a GlyphAtlas, or
+        PIL's default font rasterized once if atlas is not provided.  Returns
+        the x position just past the end of the text.  Text drawn at a y that
+        is a multiple of 8 copies whole glyph cells into place, replacing what
+        was under them.  At other positions the glyphs are drawn over what is
+        there, so clear the area first when drawing over old text.
+        """
+        if atlas is None:
+            atlas = get_atlas()
+        height = atlas.pages*8
+        aligned = (y & 7) == 0
+        overhangs = []
+        pasted = []
+        # Glyphs go at the rounded sum of the advances before them, the text
+        # moved by as much as PIL moves it for its first glyph.
+        position = 0.0
+        start = x + atlas.shift(text[0]) if text else x
+        left = start
+        for c in text:
+            if left >= self.width:
+                break
+            advance, cell, width, after, after_width, before, before_width, \
+                top, rows = atlas.glyph(c)
+            if width:
+                if aligned:
+                    self.blit(left, y, cell, width, height)
+                else:
+                    self._blit_or(left, y, cell, width, height)
+            if after_width:
+                overhangs.append((left + width, after, after_width))
+            if before_width:
+                if not atlas.pasted:
+                    overhangs.append((left - before_width, before, before_width))
+                elif left > x:
+                    pasted.append((left - before_width, before, before_width, top, rows))
+            position += advance
+            right = start + int(position + 0.5)
+            if aligned and right > left + width:
+                # Clear the column a fractional advance leaves between cells.
+                self.fill_rect(left + width, y, right - left - width, height, 0)
+            left = right
+        # Ink outside a glyph's cell goes over its neighbours' cells.
+        for column, data, width, top, rows in pasted:
+            self.blit(column, y + top, data, width, rows)
+        clip = (x, left) if atlas.pasted else None
+        for column, data, width in overhangs:
+            self._blit_or(column, y, data, width, height, clip)
+        return x + int(position + 0.5)
+
+    def _blit_or(self, x, y, data, width, height, clip=None):
+        # Turn on the pixels that are on in a page format bitmap, shifting each
+        # bitmap page across the two buffer pages it straddles.  clip limits
+        # the columns drawn to a (start, end) range of the buffer.
+        left = max(0, -x)
+        right = min(width, self.width - x)
+        if clip is not None:
+            left = max(left, clip[0] - x)
+            right = min(right, clip[1] - x)
+        if left >= right:
+            return
+        buf = self._buffer
+        shift = y & 7
+        for page in range(height//8):
+            dest_page = (y + page*8) >> 3
+            src = page*width
+            for part, bits in ((dest_page, shift), (dest_page + 1, shift - 8)):
+                if not 0 <= part < self._pages:
+                    continue
+                start = part*self.width + x
+                for i in range(left, right):
+                    value = data[src+i]
+                    value = (value << bits if bits >= 0 else value >> -bits) & 0xFF
+                    if value:
+                        buf[start+i] |= value
+
+    def _fill(self, x, y, width, height, op):
+        # Apply op to the bits of a rectangle, whole pages at a time.
+        x0 = max(x, 0)
+        x1 = min(x + width, self.width)
+        y0 = max(y, 0)
+        y1 = min(y + height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        buf = self._buffer
+        columns = x1 - x0
+        for page in range(y0//8, (y1 - 1)//8 + 1):
+            top = max(y0 - page*8, 0)
+            bottom = min(y1 - page*8, 8)
+            mask = (0xFF << top) & (0xFF >> (8 - bottom))
+            start = page*self.width + x0
+            end = start + columns
+            if mask == 0xFF and op != _INVERT:
+                buf[start:end] = (_ONES if op == _SET else _ZEROS)[:columns]
+            else:
+                buf[start:end] = bytearray(buf[start:end]).translate(_table(op, mask))
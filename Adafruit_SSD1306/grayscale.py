@@ -0,0 +1,163 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from __future__ import division
+import time
+
+from .convert import image_to_pages
+
+
+_now = getattr(time, 'monotonic', time.time)
+
+
+class TemporalGrayscale(object):
+    """Shows grayscale images on an SSD1306 display by cycling through bit
+    planes faster than the eye can follow.  A grayscale image is quantized to
+    2**planes levels and split into planes bit planes, each converted to page
+    format once.  Plane k is shown for 2**k slots of each cycle, so a pixel is
+    lit for a share of the cycle that matches its level.  With use_contrast,
+    each plane is shown for one slot instead, at a contrast weighted by its
+    bit, which needs fewer slots for the same number of levels.
+
+    Planes are written with the display's normal partial update path, so on
+    an I2C provider that takes bulk writes each plane is a few large messages.
+    The display buffer is left alone while planes are shown.
+    """
+
+    def __init__(self, display, planes=2, rate=60, use_contrast=False,
+                 contrast=0xFF):
+        """Drive display with 2 to 4 bit planes, repeating the cycle of planes
+        rate times a second.  With use_contrast, contrast is the contrast of
+        the brightest plane and is set again by stop().
+        """
+        if not 2 <= planes <= 4:
+            raise ValueError('Planes must be from 2 to 4.')
+        self._display = display
+        self.planes = planes
+        self.levels = 2**planes
+        self.rate = rate
+        self.use_contrast = use_contrast
+        self.contrast = contrast
+        # The order planes are shown in over one cycle.  Weighted slots are
+        # spread out, slot s showing the plane given by its trailing zero
+        # bits, so the heaviest plane comes every other slot.
+        if use_contrast:
+            self._order = list(reversed(range(planes)))
+        else:
+            self._order = [planes - 1 - _trailing_zeros(slot)
+                           for slot in range(1, 2**planes)]
+        self._contrasts = [max(1, int(round(contrast*2**plane/2**(planes - 1))))
+                           for plane in range(planes)]
+        # Quantize 0-255 to levels, and a lookup table per plane mapping gray
+        # values to that plane's bit.
+        scale = self.levels - 1
+        quantized = [(value*scale + 127)//255 for value in range(256)]
+        self._tables = [[255 if (level >> plane) & 1 else 0 for level in quantized]
+                        for plane in range(planes)]
+        self._frames = None
+        self._slot = 0
+        self._running = False
+        self.overruns = 0
+        self.slots_shown = 0
+
+    @property
+    def slot_rate(self):
+        """Plane writes per second needed to keep up the cycle rate."""
+        return self.rate*len(self._order)
+
+    def image(self, image):
+        """Set the grayscale image to show.  Images in other modes are
+        converted to L, and the image must be the display size.  The bit
+        planes are computed here, once.
+        """
+        if image.mode != 'L':
+            image = image.convert('L')
+        width, height = self._display.width, self._display.height
+        if image.size != (width, height):
+            raise ValueError('Image must be same dimensions as display ({0}x{1}).'
+                             .format(width, height))
+        frames = []
+        for plane in range(self.planes):
+            pages = image_to_pages(image.point(self._tables[plane], '1'), width, height)
+            frames.append((pages, memoryview(pages)))
+        self._frames = frames
+
+    def step(self):
+        """Show the next slot of the cycle now."""
+        if self._frames is None:
+            raise ValueError('Set an image to show first.')
+        plane = self._order[self._slot]
+        frame, view = self._frames[plane]
+        display = self._display
+        display._send_frame(frame, view)
+        if self.use_contrast:
+            display.set_contrast(self._contrasts[plane])
+        self._slot = (self._slot + 1) % len(self._order)
+        self.slots_shown += 1
+
+    def run(self, duration=None):
+        """Cycle the planes at the slot rate until stop() is called, or for
+        duration seconds if it is provided.  Slots that can't be written in
+        time are counted in overruns and the schedule starts over from the
+        time they finished, so the cadence doesn't try to catch up in bursts.
+        """
+        period = 1.0/self.slot_rate
+        self._running = True
+        start = deadline = _now()
+        while self._running and (duration is None or _now() - start < duration):
+            self.step()
+            deadline += period
+            remaining = deadline - _now()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                self.overruns += 1
+                deadline = _now()
+        self._running = False
+
+    def stop(self):
+        """Make run() return and put the contrast back when it was changed."""
+        self._running = False
+        if self.use_contrast:
+            self._display.set_contrast(self.contrast)
+
+    def check_rate(self, samples=None):
+        """Time writing the planes of the current image and return a dict with
+        the slot rate needed, the highest slot rate the display's transport
+        managed and whether it is enough.  Writes samples slots, two full
+        cycles by default.
+        """
+        if samples is None:
+            samples = 2*len(self._order)
+        start = _now()
+        for _ in range(samples):
+            self.step()
+        elapsed = _now() - start
+        achieved = samples/elapsed if elapsed > 0 else float('inf')
+        return {'required_rate': self.slot_rate,
+                'max_rate': achieved,
+                'sustainable': achieved >= self.slot_rate}
+
+
+def _trailing_zeros(value):
+    count = 0
+    while not value & 1:
+        value >>= 1
+        count += 1
+    return count
@@ -0,0 +1,179 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from .SSD1306 import SSD1306_SWITCHCAPVCC
+
+
+_now = getattr(time, 'monotonic', time.time)
+
+
+def bus_key(display):
+    """Return a key naming the physical bus a display is attached to.  Displays
+    on the platform I2C provider are keyed by their /dev/i2c-N device, other
+    I2C devices and SPI displays by their transport object.  Devices of the
+    Linux backend are keyed by their device path.
+    """
+    if display._spi is not None:
+        path = getattr(display._spi, 'path', None)
+        return ('spi', path if path is not None else id(display._spi))
+    path = getattr(display._i2c, 'path', None)
+    if path is not None:
+        return ('i2c', path)
+    bus = getattr(display._i2c, '_bus', None)
+    name = getattr(getattr(bus, '_device', None), 'name', None)
+    if name is not None:
+        return ('i2c', name)
+    return ('i2c', id(bus if bus is not None else display._i2c))
+
+
+class _BusWorker(object):
+    # Thread that runs jobs for the displays on one bus, one after another.
+
+    def __init__(self, key):
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(target=self._run,
+                                        name='SSD1306 bus {0}'.format(key))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def submit(self, job):
+        self._jobs.put(job)
+
+    def stop(self):
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            job()
+
+
+class DisplayGroup(object):
+    """Group of SSD1306 displays that are refreshed together.  Displays are
+    grouped by the bus they are on, displays on different buses are written
+    at the same time by one worker thread per bus, and displays sharing a bus
+    are written one after another.
+    """
+
+    def __init__(self, displays=None):
+        """Create a group, optionally adding a list of displays to it."""
+        self._buses = {}
+        self._order = []
+        self._workers = {}
+        self.panel_times = {}
+        self.group_time = None
+        for display in displays or []:
+            self.add(display)
+
+    def add(self, display, bus=None):
+        """Add a display to the group.  The bus it is on is worked out from its
+        transport, pass any hashable value as bus to override that, for
+        example to put SPI displays using different chip selects of the same
+        controller on one bus.
+        """
+        if bus is None:
+            bus = bus_key(display)
+        if bus not in self._buses:
+            self._buses[bus] = []
+            self._order.append(bus)
+            self._workers[bus] = _BusWorker(bus)
+        self._buses[bus].append(display)
+
+    def remove(self, display):
+        """Remove a display from the group."""
+        for bus in list(self._order):
+            panels = self._buses[bus]
+            if display in panels:
+                panels.remove(display)
+                self.panel_times.pop(display, None)
+                if not panels:
+                    del self._buses[bus]
+                    self._order.remove(bus)
+                    self._workers.pop(bus).stop()
+                return
+        raise ValueError('Display is not in the group.')
+
+    @property
+    def displays(self):
+        """List of the displays in the group."""
+        return [display for bus in self._order for display in self._buses[bus]]
+
+    def begin(self, vccstate=SSD1306_SWITCHCAPVCC, warm=False):
+        """Initialize every display in the group, see SSD1306Base.begin()."""
+        self._run(lambda display: display.begin(vccstate, warm))
+
+    def display(self):
+        """Write the buffer of every display in the group to its physical
+        display and return how long the whole group took in seconds.  The time
+        each display took is kept in the panel_times dict, keyed by display,
+        and the group time in group_time.
+        """
+        self.group_time = self._run(lambda display: display.display())
+        return self.group_time
+
+    def close(self):
+        """Stop the bus worker threads."""
+        for bus in self._order:
+            self._workers[bus].stop()
+        self._buses = {}
+        self._order = []
+        self._workers = {}
+
+    def _run(self, func):
+        # Call func on every display, concurrently across buses, and raise the
+        # first error any of them hit once all buses are done.
+        done = threading.Condition()
+        state = {'remaining': len(self._order), 'error': None}
+        times = self.panel_times
+
+        def job(panels):
+            try:
+                for display in panels:
+                    start = _now()
+                    func(display)
+                    times[display] = _now() - start
+            except Exception as ex:
+                with done:
+                    if state['error'] is None:
+                        state['error'] = ex
+            finally:
+                with done:
+                    state['remaining'] -= 1
+                    done.notify()
+
+        start = _now()
+        for bus in self._order:
+            self._workers[bus].submit(lambda panels=list(self._buses[bus]): job(panels))
+        with done:
+            while state['remaining']:
+                done.wait()
+        if state['error'] is not None:
+            raise state['error']
+        return _now() - start
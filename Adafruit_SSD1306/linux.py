@@ -0,0 +1,209 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Transports that talk to the Linux kernel drivers directly with os.write and
+# ioctl calls, for the i2c, spi and gpio parameters of the display classes:
+#
+#   disp = SSD1306_128_64(rst=None, i2c=LinuxI2C(1))
+#   disp = SSD1306_128_64(rst=25, dc=24, spi=LinuxSPI(0, 0), gpio=LinuxGPIO())
+#
+# Device paths can be given explicitly, for example to point them at a plain
+# file or pty in tests.  ioctl calls that such stand-ins reject with ENOTTY or
+# EINVAL are skipped.
+import errno
+import fcntl
+import os
+import struct
+
+
+# ioctl request numbers from linux/i2c-dev.h, linux/spi/spidev.h and
+# linux/gpio.h (version 1 of the GPIO character device ABI).
+I2C_SLAVE = 0x0703
+SPI_IOC_WR_MODE = 0x40016B01
+SPI_IOC_WR_MAX_SPEED_HZ = 0x40046B04
+GPIO_GET_LINEHANDLE_IOCTL = 0xC16CB403
+GPIOHANDLE_SET_LINE_VALUES_IOCTL = 0xC040B409
+GPIOHANDLE_REQUEST_INPUT = 1 << 0
+GPIOHANDLE_REQUEST_OUTPUT = 1 << 1
+
+# Pin modes, with the same values as Adafruit_GPIO.OUT and Adafruit_GPIO.IN.
+OUT = 0
+IN = 1
+
+# Largest transfer spidev takes by default.
+SPI_MAX_TRANSFER = 4096
+
+# struct gpiohandle_request: line offsets, flags, default values, consumer
+# label, number of lines and the returned line handle.
+_LINEHANDLE_REQUEST = struct.Struct('64I I 64B 32s I i')
+
+
+def _ioctl(fd, request, arg):
+    # Call ioctl, returning None when fd is a stand-in that isn't the device.
+    try:
+        return fcntl.ioctl(fd, request, arg)
+    except (IOError, OSError) as ex:
+        if ex.errno in (errno.ENOTTY, errno.EINVAL):
+            return None
+        raise
+
+
+def _write(fd, data):
+    # Write data with a single write call, which is one bus transaction for
+    # i2c-dev and spidev.
+    written = os.write(fd, data)
+    if written != len(data):
+        raise IOError(errno.EIO, 'Short write of {0} of {1} bytes.'.format(
+            written, len(data)))
+
+
+class LinuxI2C(object):
+    """I2C provider that opens /dev/i2c-N directly."""
+
+    def __init__(self, busnum=1, path=None):
+        """Use I2C bus busnum, or the device at path if it is provided."""
+        self.path = path or '/dev/i2c-{0}'.format(busnum)
+
+    def get_i2c_device(self, address, **kwargs):
+        """Return a LinuxI2CDevice for the device at address."""
+        return LinuxI2CDevice(self.path, address)
+
+
+class LinuxI2CDevice(object):
+    """I2C device on an i2c-dev bus.  Every write is a single message: the
+    register or control byte followed by the data.
+    """
+
+    def __init__(self, path, address):
+        """Open the bus at path and select the device at address."""
+        self.path = path
+        self._address = address
+        self._fd = os.open(path, os.O_RDWR)
+        _ioctl(self._fd, I2C_SLAVE, address)
+
+    def write8(self, register, value):
+        """Write an 8-bit value to the specified register."""
+        _write(self._fd, bytearray([register, value & 0xFF]))
+
+    def writeList(self, register, data):
+        """Write bytes to the specified register."""
+        _write(self._fd, bytearray([register]) + bytearray(data))
+
+    def writeBytes(self, data):
+        """Write raw bytes to the device as one message."""
+        _write(self._fd, data)
+
+    def close(self):
+        """Close the bus device."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class LinuxSPI(object):
+    """SPI device that writes to /dev/spidevX.Y directly."""
+
+    def __init__(self, port=0, device=0, path=None):
+        """Use SPI device port.device, or the device at path if it is
+        provided.  The device is set to SPI mode 0.
+        """
+        self.path = path or '/dev/spidev{0}.{1}'.format(port, device)
+        self._fd = os.open(self.path, os.O_RDWR)
+        _ioctl(self._fd, SPI_IOC_WR_MODE, struct.pack('B', 0))
+
+    def set_clock_hz(self, hz):
+        """Set the SPI clock speed in hertz."""
+        _ioctl(self._fd, SPI_IOC_WR_MAX_SPEED_HZ, struct.pack('I', hz))
+
+    def write(self, data):
+        """Write bytes to the device, one transfer per 4096 bytes."""
+        if not isinstance(data, (bytearray, memoryview)):
+            data = bytearray(data)
+        for i in range(0, len(data), SPI_MAX_TRANSFER):
+            _write(self._fd, data[i:i+SPI_MAX_TRANSFER])
+
+    def close(self):
+        """Close the SPI device."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class LinuxGPIO(object):
+    """GPIO adapter using the Linux GPIO character device, for the DC and reset
+    pins.  Pins are line offsets on the chip.  Each pin set up as an output
+    gets its own line handle, so setting it is a single ioctl.
+    """
+
+    def __init__(self, chip=0, path=None, consumer='Adafruit_SSD1306'):
+        """Use /dev/gpiochipN for chip N, or the device at path if it is
+        provided.
+        """
+        self.path = path or '/dev/gpiochip{0}'.format(chip)
+        self._consumer = consumer.encode('ascii')
+        self._fd = os.open(self.path, os.O_RDWR)
+        self._lines = {}
+        # Last value set on each pin, also kept for stand-in devices.
+        self.values = {}
+
+    def setup(self, pin, mode, pull_up_down=None):
+        """Request a pin as an output (OUT) or input (IN)."""
+        flags = GPIOHANDLE_REQUEST_OUTPUT if mode == OUT else GPIOHANDLE_REQUEST_INPUT
+        offsets = [pin] + [0]*63
+        request = _LINEHANDLE_REQUEST.pack(*(offsets + [flags] + [0]*64 +
+                                             [self._consumer, 1, 0]))
+        self.release(pin)
+        result = _ioctl(self._fd, GPIO_GET_LINEHANDLE_IOCTL, request)
+        if result is not None:
+            self._lines[pin] = _LINEHANDLE_REQUEST.unpack(result)[-1]
+        self.values[pin] = 0
+
+    def output(self, pin, value):
+        """Set a pin high if value is true and low otherwise."""
+        value = 1 if value else 0
+        if pin not in self.values:
+            self.setup(pin, OUT)
+        line = self._lines.get(pin)
+        if line is not None:
+            fcntl.ioctl(line, GPIOHANDLE_SET_LINE_VALUES_IOCTL,
+                        struct.pack('64B', value, *([0]*63)))
+        self.values[pin] = value
+
+    def set_high(self, pin):
+        """Set a pin high."""
+        self.output(pin, 1)
+
+    def set_low(self, pin):
+        """Set a pin low."""
+        self.output(pin, 0)
+
+    def release(self, pin):
+        """Give a pin back to the kernel."""
+        line = self._lines.pop(pin, None)
+        if line is not None:
+            os.close(line)
+
+    def close(self):
+        """Release all pins and close the chip device."""
+        for pin in list(self._lines):
+            self.release(pin)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,136 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from __future__ import division
+import collections
+import math
+import time
+
+
+_now = getattr(time, 'monotonic', time.time)
+
+
+class FrameScheduler(object):
+    """Runs a render loop for a display at a target frame rate.  Each frame
+    calls render(display), which either draws into the display buffer and
+    returns None or returns a PIL image to show, then converts the image if
+    there is one and writes the buffer with display().  The time each of those
+    steps takes is measured, and the loop only sleeps for what is left of the
+    frame budget.  When a frame runs over budget the loop doesn't sleep, and
+    frame slots that were missed entirely are skipped rather than rendered
+    late, so the loop catches up with the schedule instead of drifting.
+    """
+
+    def __init__(self, display, render, fps=10, window=100):
+        """Create a scheduler for display that calls render for each frame, at
+        fps frames per second.  Statistics cover the last window frames.
+        """
+        if fps <= 0:
+            raise ValueError('Frame rate must be greater than 0.')
+        self._display = display
+        self._render = render
+        self.period = 1.0/fps
+        self._running = False
+        self._next = None
+        self._starts = collections.deque(maxlen=window)
+        self._render_times = collections.deque(maxlen=window)
+        self._convert_times = collections.deque(maxlen=window)
+        self._transfer_times = collections.deque(maxlen=window)
+        self.frames = 0
+        self.overruns = 0
+        self.skipped = 0
+
+    def step(self):
+        """Render, convert and display one frame now without any pacing, and
+        return the time it took in seconds.
+        """
+        start = _now()
+        self._starts.append(start)
+        image = self._render(self._display)
+        rendered = _now()
+        if image is not None:
+            self._display.image(image)
+        converted = _now()
+        self._display.display()
+        done = _now()
+        self._render_times.append(rendered - start)
+        self._convert_times.append(converted - rendered)
+        self._transfer_times.append(done - converted)
+        self.frames += 1
+        return done - start
+
+    def run(self, frames=None):
+        """Run the render loop until stop() is called, or for a number of
+        frames if frames is given.
+        """
+        self._running = True
+        self._next = _now()
+        count = 0
+        while self._running and (frames is None or count < frames):
+            self.step()
+            count += 1
+            self._next += self.period
+            now = _now()
+            if now > self._next:
+                self.overruns += 1
+                # Skip the frame slots that have already gone by.
+                missed = int((now - self._next)//self.period)
+                if missed:
+                    self.skipped += missed
+                    self._next += missed*self.period
+            else:
+                time.sleep(self._next - now)
+        self._running = False
+
+    def stop(self):
+        """Make run() return after the current frame, for example from the
+        render callback or another thread.
+        """
+        self._running = False
+
+    def stats(self):
+        """Return a dict of statistics over the recent frames: the achieved
+        frame rate, the jitter (standard deviation of the time between frame
+        starts) in seconds, the mean render, convert and transfer times in
+        seconds, and the total frame, overrun and skipped counts.
+        """
+        starts = list(self._starts)
+        intervals = [b - a for a, b in zip(starts, starts[1:])]
+        fps = 0.0
+        jitter = 0.0
+        if intervals:
+            mean = sum(intervals)/len(intervals)
+            if mean > 0:
+                fps = 1.0/mean
+            jitter = math.sqrt(sum((i - mean)**2 for i in intervals)/len(intervals))
+        return {
+            'fps': fps,
+            'target_fps': 1.0/self.period,
+            'jitter': jitter,
+            'render': _mean(self._render_times),
+            'convert': _mean(self._convert_times),
+            'transfer': _mean(self._transfer_times),
+            'frames': self.frames,
+            'overruns': self.overruns,
+            'skipped': self.skipped,
+        }
+
+
+def _mean(values):
+    return sum(values)/len(values) if values else 0.0
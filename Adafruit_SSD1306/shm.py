@@ -0,0 +1,282 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Shared memory frame buffer, so several processes can draw on one display.
+# A FramebufferServer owns the display and publishes a frame buffer in page
+# format as a file under /dev/shm that clients map into memory.  Clients draw
+# straight into the mapping with SharedFramebuffer and then send the server a
+# datagram naming the region they changed.  The server copies changed regions
+# into the display buffer and writes them out, at most max_fps times a second.
+#
+# Run a server for an I2C display with:
+#
+#   python -m Adafruit_SSD1306.shm --panel 128x64 --bus 1
+#
+# Clients are expected to draw in their own regions, nothing stops two of
+# them from drawing over each other.
+from __future__ import division
+import argparse
+import errno
+import mmap
+import os
+import socket
+import struct
+import time
+
+from .convert import dither_to_pages, image_to_pages, DITHER_FLOYD_STEINBERG, \
+    DITHER_THRESHOLD
+from .framebuf import PageBuffer
+
+
+DEFAULT_PATH = '/dev/shm/Adafruit_SSD1306'
+
+# The mapped file starts with a header giving the display size, followed by
+# the frame buffer.
+_HEADER = struct.Struct('<4sHH')
+_MAGIC = b'OLED'
+
+# A frame ready notification: first and last column, first and last page.
+_REGION = struct.Struct('<BBBB')
+
+_now = getattr(time, 'monotonic', time.time)
+
+
+def _socket_path(path):
+    return path + '.sock'
+
+
+class FramebufferServer(object):
+    """Owns an SSD1306Base display and shares its frame buffer with other
+    processes through a memory mapped file at path.  Regions clients report
+    as ready are copied into the display buffer and written to the display,
+    with at most max_fps updates a second.
+    """
+
+    def __init__(self, display, path=DEFAULT_PATH, max_fps=30):
+        """Create the shared frame buffer for display at path, and the socket
+        clients notify at path + '.sock'.  The shared buffer starts out as a
+        copy of the display buffer.
+        """
+        self._display = display
+        self.path = path
+        self.min_interval = 1.0/max_fps if max_fps else 0.0
+        self._size = len(display.buffer)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            os.ftruncate(fd, _HEADER.size + self._size)
+            self._map = mmap.mmap(fd, _HEADER.size + self._size)
+        finally:
+            os.close(fd)
+        self._map[:_HEADER.size] = _HEADER.pack(_MAGIC, display.width, display.height)
+        self._shared = memoryview(self._map)[_HEADER.size:]
+        self._shared[:] = display.buffer
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            os.unlink(_socket_path(path))
+        except OSError as ex:
+            if ex.errno != errno.ENOENT:
+                raise
+        self._socket.bind(_socket_path(path))
+        self._dirty = []
+        self._last_flush = None
+        self._running = False
+        self.flushes = 0
+
+    def handle(self, timeout=None):
+        """Wait up to timeout seconds (forever if None) for notifications,
+        and write the regions they name to the display once the rate limit
+        allows.  Returns True if the display was written.
+        """
+        self._receive(timeout)
+        if not self._dirty:
+            return False
+        if self._last_flush is not None:
+            wait = self._last_flush + self.min_interval - _now()
+            while wait > 0:
+                # Keep collecting regions until the next update is due.
+                self._receive(wait)
+                wait = self._last_flush + self.min_interval - _now()
+        self.flush()
+        return True
+
+    def flush(self):
+        """Copy the regions reported so far into the display buffer and write
+        them to the display.
+        """
+        buf = self._display.buffer
+        width = self._display.width
+        for c0, c1, p0, p1 in self._dirty:
+            for page in range(p0, p1 + 1):
+                start = page*width + c0
+                end = page*width + c1 + 1
+                buf[start:end] = self._shared[start:end]
+        self._dirty = []
+        self._display.display()
+        self._last_flush = _now()
+        self.flushes += 1
+
+    def serve_forever(self):
+        """Handle notifications until stop() is called."""
+        self._running = True
+        while self._running:
+            self.handle(0.5)
+
+    def stop(self):
+        """Make serve_forever() return."""
+        self._running = False
+
+    def close(self):
+        """Remove the shared frame buffer and socket."""
+        self._running = False
+        self._socket.close()
+        self._shared.release()
+        self._map.close()
+        for path in (self.path, _socket_path(self.path)):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def _receive(self, timeout):
+        # Read notifications until none are waiting, blocking for the first
+        # one for up to timeout seconds.
+        self._socket.settimeout(timeout)
+        while True:
+            try:
+                message = self._socket.recv(64)
+            except socket.timeout:
+                return
+            except socket.error as ex:
+                if ex.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return
+                raise
+            if len(message) == _REGION.size:
+                self._add_region(*_REGION.unpack(message))
+            self._socket.settimeout(0)
+
+    def _add_region(self, c0, c1, p0, p1):
+        # Clip a reported region to the display and remember it.
+        c1 = min(c1, self._display.width - 1)
+        p1 = min(p1, self._display.height//8 - 1)
+        if c0 <= c1 and p0 <= p1:
+            self._dirty.append((c0, c1, p0, p1))
+
+
+class SharedFramebuffer(PageBuffer):
+    """Client of a FramebufferServer.  Drawing methods and image() work like
+    those of the display classes but change the shared frame buffer, and
+    display() tells the server to put a region of it on the display.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        """Map the shared frame buffer of the server at path."""
+        self.path = path
+        fd = os.open(path, os.O_RDWR)
+        try:
+            header = os.read(fd, _HEADER.size)
+            magic, self.width, self.height = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError('{0} is not a shared frame buffer.'.format(path))
+            self._pages = self.height//8
+            self._map = mmap.mmap(fd, _HEADER.size + self.width*self._pages)
+        finally:
+            os.close(fd)
+        self._buffer = memoryview(self._map)[_HEADER.size:]
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+    @property
+    def buffer(self):
+        """Memoryview of the shared frame buffer in SSD1306 page format."""
+        return self._buffer
+
+    def image(self, image, dither=None):
+        """Set the shared buffer to value of Python Imaging Library image.
+        Images that aren't 1 bit and the display size are scaled and dithered
+        like the display classes' image() does.
+        """
+        if dither is None and image.mode == '1' and \
+           image.size == (self.width, self.height):
+            self._buffer[:] = image_to_pages(image, self.width, self.height)
+            return
+        if dither is None:
+            dither = DITHER_THRESHOLD if image.mode == '1' else DITHER_FLOYD_STEINBERG
+        self._buffer[:] = dither_to_pages(image, self.width, self.height, dither)
+
+    def clear(self):
+        """Clear contents of the shared buffer."""
+        self.fill_rect(0, 0, self.width, self.height, 0)
+
+    def display(self, x=0, y=0, width=None, height=None):
+        """Tell the server the rectangle with its top left corner at x, y is
+        ready to be shown, the whole display if width and height are not
+        provided.  The rectangle is widened to whole pages.
+        """
+        if width is None:
+            width = self.width - x
+        if height is None:
+            height = self.height - y
+        x0 = max(x, 0)
+        x1 = min(x + width, self.width) - 1
+        y0 = max(y, 0)
+        y1 = min(y + height, self.height) - 1
+        if x0 > x1 or y0 > y1:
+            return
+        self._socket.sendto(_REGION.pack(x0, x1, y0//8, y1//8),
+                            _socket_path(self.path))
+
+    def close(self):
+        """Unmap the shared frame buffer."""
+        self._socket.close()
+        self._buffer.release()
+        self._map.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Share an I2C SSD1306 display '
+                                     'with other processes.')
+    parser.add_argument('--panel', default='128x64',
+                        choices=['128x64', '128x32', '96x16'])
+    parser.add_argument('--bus', type=int, default=None, help='I2C bus number.')
+    parser.add_argument('--address', type=lambda value: int(value, 0),
+                        default=0x3C, help='I2C address.')
+    parser.add_argument('--rst', type=int, default=None, help='Reset pin.')
+    parser.add_argument('--path', default=DEFAULT_PATH,
+                        help='Shared frame buffer file.')
+    parser.add_argument('--fps', type=float, default=30,
+                        help='Most display updates a second.')
+    args = parser.parse_args()
+    from . import SSD1306
+    panel = {'128x64': SSD1306.SSD1306_128_64, '128x32': SSD1306.SSD1306_128_32,
+             '96x16': SSD1306.SSD1306_96_16}[args.panel]
+    display = panel(args.rst, i2c_bus=args.bus, i2c_address=args.address)
+    display.begin()
+    display.clear()
+    display.display()
+    server = FramebufferServer(display, args.path, args.fps)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from __future__ import division
+import threading
+import time
+
+
+_now = getattr(time, 'monotonic', time.time)
+
+# Latency histograms have one bucket per power of two microseconds, bucket i
+# counting calls that took less than 2**i microseconds (and at least half
+# that).  The last bucket also counts anything slower.
+LATENCY_BUCKETS = 32
+
+
+class BusStats(object):
+    """Counters for the bus traffic and call latencies of SSD1306 displays,
+    enabled with enable_stats() on a display.  Every write to the SPI or I2C
+    transport counts as one transaction, its display bytes as payload and the
+    I2C address and control bytes as overhead.  SPI transfers also count the
+    DC pin changes between commands and data.  One BusStats can be shared by
+    several displays to add up their traffic.
+    """
+
+    def __init__(self, exporter=None, interval=None):
+        """Create empty counters.  exporter is an optional function that is
+        called with a snapshot() dict by export(), and also after a display()
+        call once every interval seconds if interval is provided.
+        """
+        self.exporter = exporter
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._last_export = _now()
+        self.reset()
+
+    def reset(self):
+        """Set all counters back to zero."""
+        with self._lock:
+            self.transactions = 0
+            self.payload_bytes = 0
+            self.overhead_bytes = 0
+            self.dc_toggles = 0
+            self.i2c_fallbacks = 0
+            self._latency = {}
+
+    def write(self, payload, overhead):
+        """Count one bus transaction carrying payload display bytes and
+        overhead protocol bytes.
+        """
+        with self._lock:
+            self.transactions += 1
+            self.payload_bytes += payload
+            self.overhead_bytes += overhead
+
+    def dc_toggle(self):
+        """Count a change of the DC pin."""
+        with self._lock:
+            self.dc_toggles += 1
+
+    def i2c_fallback(self):
+        """Count a switch from bulk to block I2C writes."""
+        with self._lock:
+            self.i2c_fallbacks += 1
+
+    def time(self, operation, seconds):
+        """Add a call of operation that took seconds to its latency histogram."""
+        bucket = min(int(seconds*1000000).bit_length(), LATENCY_BUCKETS - 1)
+        with self._lock:
+            entry = self._latency.get(operation)
+            if entry is None:
+                entry = self._latency[operation] = [0, 0.0, 0.0, [0]*LATENCY_BUCKETS]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+            entry[3][bucket] += 1
+
+    def snapshot(self):
+        """Return the counters as a dict.  latency maps each operation to its
+        call count, total and maximum time in seconds, and histogram, a list
+        where entry i counts calls that took less than 2**i microseconds.
+        """
+        with self._lock:
+            latency = {}
+            for operation, (count, total, longest, buckets) in self._latency.items():
+                latency[operation] = {'count': count, 'total': total,
+                                      'max': longest, 'histogram': list(buckets)}
+            return {
+                'transactions': self.transactions,
+                'payload_bytes': self.payload_bytes,
+                'overhead_bytes': self.overhead_bytes,
+                'dc_toggles': self.dc_toggles,
+                'i2c_fallbacks': self.i2c_fallbacks,
+                'latency': latency,
+            }
+
+    def export(self):
+        """Pass a snapshot to the exporter, if there is one, and return it."""
+        self._last_export = _now()
+        snapshot = self.snapshot()
+        if self.exporter is not None:
+            self.exporter(snapshot)
+        return snapshot
+
+    def frame_done(self):
+        """Called after each display() to export on the configured interval."""
+        if self.interval is not None and self.exporter is not None and \
+           _now() - self._last_export >= self.interval:
+            self.export()
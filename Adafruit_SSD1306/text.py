@@ -0,0 +1,218 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+from __future__ import division
+import threading
+
+from .convert import image_to_pages
+
+
+# Printable ASCII, rasterized when no character set is given.
+DEFAULT_CHARS = ''.join(chr(c) for c in range(32, 127))
+
+_atlases = {}
+_atlases_lock = threading.Lock()
+
+
+class GlyphAtlas(object):
+    """Font rasterized once into the SSD1306 page format.  Each glyph is drawn
+    with the Python Imaging Library into a cell as wide as its advance and as
+    tall as the font's line, then stored as page bytes so drawing text is a
+    copy of a few columns per glyph.  Ink a glyph draws left of its origin or
+    past its advance is stored apart from the cell, to be drawn over the
+    neighbouring cells.  PIL is only needed to build the atlas.
+
+    Glyphs are placed like PIL places them, at the rounded sum of the
+    advances before them, so drawn text matches ImageDraw.text for PIL's
+    default fonts.  PIL lines TrueType text up by the outlines of the glyphs
+    in it, so with other fonts and kerned pairs a glyph can land a pixel away
+    from where PIL draws it.
+    """
+
+    def __init__(self, font=None, chars=DEFAULT_CHARS):
+        """Rasterize chars with a PIL ImageFont, or PIL's default font if font
+        is not provided.
+        """
+        from PIL import Image, ImageDraw, ImageFont
+        if font is None:
+            font = ImageFont.load_default()
+        if hasattr(font, 'getmetrics'):
+            ascent, descent = font.getmetrics()
+            height = ascent + descent
+            self.pasted = False
+        else:
+            height = max(_bbox(font, c)[3] for c in chars)
+            # PIL pastes the glyphs of bitmap fonts box by box, so ink left of
+            # a glyph's origin replaces what is under it, and crops the text to
+            # the sum of its advances.
+            self.pasted = True
+        # Line height in pixels and the number of pages a glyph cell covers.
+        self.height = height
+        self.pages = (height + 7)//8
+        rows = self.pages*8
+        # PIL crops a bitmap font's ink left of the start of the text, so its
+        # glyphs are drawn after a few spaces.
+        lead = ' '*(self.pages*2) if self.pasted else ''
+        lead_width = int(_advance(font, lead) + 0.5) if lead else 0
+        # Columns each glyph's ink moves by when it follows another glyph,
+        # compared to drawing it alone.
+        self._shifts = {} if self.pasted else _string_shifts(font, chars, rows)
+        self._glyphs = {}
+        self._data = bytearray()
+        for c in chars:
+            advance = _advance(font, c)
+            # Whole columns of the cell, ink in a column only partly covered
+            # by the advance is or-ed in with the ink past it.
+            width = int(advance)
+            # Draw into a roomy cell and measure the ink, glyphs can draw past
+            # their advance and past the bounding box the font reports.  The
+            # cell is stored where the glyph lands after another glyph.
+            left = max(lead_width, -_bbox(font, c)[0]) + rows
+            origin = left - self._shifts.get(c, 0)
+            cell = Image.new('1', (left + width + 3*rows, rows))
+            ImageDraw.Draw(cell).text((left - lead_width, 0), lead + c,
+                                      font=font, fill=255)
+            ink = cell.getbbox() or (origin, 0, origin, 0)
+            before = max(0, origin - ink[0])
+            after = max(0, ink[2] - origin - width)
+            # Rows of the ink left of the origin, all of them unless it is
+            # pasted with the rows of the glyph's box.
+            top, bottom = (ink[1], ink[3]) if self.pasted else (0, rows)
+            offset = len(self._data)
+            for x, y, columns, lines in ((origin, 0, width, rows),
+                                         (origin + width, 0, after, rows),
+                                         (origin - before, top, before, bottom - top)):
+                if columns > 0:
+                    lines = (lines + 7)//8*8
+                    self._data += image_to_pages(cell.crop((x, y, x + columns, y + lines)),
+                                                 columns, lines)
+            self._glyphs[c] = (offset, advance, width, after, before, top, bottom)
+        self._view = memoryview(self._data)
+        # Characters that aren't in the atlas are drawn as ? or skipped.
+        self._missing = self._glyphs.get('?', (0, 0, 0, 0, 0, 0, 0))
+
+    def glyph(self, c):
+        """Return a character's glyph as a tuple of its advance, which can be
+        fractional, its cell bitmap and width, the bitmap and width of the
+        columns it draws past the cell, and the bitmap, width, first row and
+        height of the columns it draws left of its origin.  Bitmaps are in page
+        format, the first two with one row of bytes for each page of the atlas
+        height.
+        """
+        offset, advance, width, after, before, top, bottom = \
+            self._glyphs.get(c, self._missing)
+        pages = self.pages
+        split = offset + width*pages
+        end = split + after*pages
+        return (advance, self._view[offset:split], width,
+                self._view[split:end], after,
+                self._view[end:end+before*((bottom - top + 7)//8)], before,
+                top, bottom - top)
+
+    def shift(self, c):
+        """Return the columns text starting with c is moved by, as PIL lines
+        text up by its first glyph.
+        """
+        return -self._shifts.get(c, 0)
+
+    def text_width(self, text):
+        """Return the width in pixels of text drawn with this atlas."""
+        missing = self._missing
+        return int(sum(self._glyphs.get(c, missing)[1] for c in text) + 0.5)
+
+
+def get_atlas(font=None, size=None, chars=DEFAULT_CHARS):
+    """Return a cached GlyphAtlas.  font can be a PIL ImageFont, the path of a
+    TrueType font to load at size, or None for PIL's default font.  Atlases
+    are built once for each font file and size.
+    """
+    if font is None:
+        key = ('default', None, chars)
+    elif isinstance(font, str):
+        key = (font, size, chars)
+    else:
+        # Fonts without a file, like bitmap fonts, are keyed by the font object
+        # itself, which keeps it alive so the key can't be reused by another.
+        path = getattr(font, 'path', None)
+        key = (path if isinstance(path, str) else font,
+               getattr(font, 'size', None), chars)
+    with _atlases_lock:
+        atlas = _atlases.get(key)
+        if atlas is None:
+            if isinstance(font, str):
+                from PIL import ImageFont
+                font = ImageFont.truetype(font, size)
+            atlas = _atlases[key] = GlyphAtlas(font, chars)
+    return atlas
+
+
+def _bbox(font, c):
+    if hasattr(font, 'getbbox'):
+        try:
+            return font.getbbox(c, mode='1')
+        except TypeError:
+            return font.getbbox(c)
+    width, height = font.getsize(c)
+    return (0, 0, width, height)
+
+
+def _string_shifts(font, chars, rows):
+    # Compare each glyph drawn after a reference glyph to the two drawn alone,
+    # and return the columns it moves by for the glyphs where that isn't what
+    # most glyphs do.  Glyphs where no move explains the difference are left
+    # alone.
+    from PIL import Image, ImageChops, ImageDraw
+    reference = next((c for c in 'HIo1' if c in chars), chars[0])
+    size = (int(_advance(font, reference + max(chars, key=lambda c: _advance(font, c)))) +
+            8*rows, 2*rows)
+
+    def draw(text, x):
+        image = Image.new('1', size)
+        ImageDraw.Draw(image).text((x, 0), text, font=font, fill=255)
+        return image
+
+    start = 2*rows
+    alone = draw(reference, start)
+    after = int(_advance(font, reference) + 0.5)
+    moves = {}
+    for c in chars:
+        pair = draw(reference + c, start).tobytes()
+        for move in (0, 1, -1, 2, -2):
+            glyph = draw(c, start + after + move)
+            if ImageChops.logical_or(alone, glyph).tobytes() == pair:
+                moves[c] = move
+                break
+    counts = {}
+    for move in moves.values():
+        counts[move] = counts.get(move, 0) + 1
+    usual = max(counts, key=counts.get) if counts else 0
+    return dict((c, move - usual) for c, move in moves.items() if move != usual)
+
+
+def _advance(font, c):
+    if hasattr(font, 'getlength'):
+        # Measure with the hinting used for 1 bit text, which can change the
+        # advances of TrueType fonts.
+        try:
+            return font.getlength(c, mode='1')
+        except TypeError:
+            return font.getlength(c)
+    if hasattr(font, 'getsize'):
+        return font.getsize(c)[0]
+    return _bbox(font, c)[2]
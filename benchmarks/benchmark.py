@@ -0,0 +1,306 @@
+# Copyright (c) 2026 Adafruit Industries
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Benchmarks for image conversion, clearing, display updates and display
+# initialization of every panel class, run against fake I2C, SPI and GPIO
+# providers so no hardware is needed.  The fakes count bus transactions and
+# bytes, and the time those would take is modeled for 100 kHz, 400 kHz and
+# 1 MHz I2C buses (and the SPI clock the library asks for).
+#
+# Run from a checkout to benchmark the library in it:
+#
+#   python benchmarks/benchmark.py --output before.json
+#   (make changes)
+#   python benchmarks/benchmark.py --output after.json --compare before.json
+from __future__ import division, print_function
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import Adafruit_SSD1306
+
+from PIL import Image
+
+
+_now = getattr(time, 'perf_counter', time.time)
+
+PANELS = [Adafruit_SSD1306.SSD1306_128_64,
+          Adafruit_SSD1306.SSD1306_128_32,
+          Adafruit_SSD1306.SSD1306_96_16]
+
+TRANSPORTS = ['i2c-block', 'i2c-bulk', 'spi']
+
+I2C_SPEEDS = [('100kHz', 100000), ('400kHz', 400000), ('1MHz', 1000000)]
+
+
+class BusCounter(object):
+    """Transactions and bytes written to a fake bus."""
+
+    def __init__(self):
+        self.transactions = 0
+        self.bytes = 0
+        self.clock_hz = None
+
+    def add(self, count):
+        self.transactions += 1
+        self.bytes += count
+
+
+class FakeI2CDevice(object):
+    """I2C device that counts writes.  Bytes counted include the control byte
+    but not the address byte, which bus_time() adds per transaction.
+    """
+
+    def __init__(self, counter):
+        self._counter = counter
+
+    def write8(self, register, value):
+        self._counter.add(2)
+
+    def writeList(self, register, data):
+        self._counter.add(1 + len(data))
+
+
+class FakeBulkI2CDevice(FakeI2CDevice):
+    """I2C device that also takes whole messages, like i2c-dev does."""
+
+    def writeBytes(self, data):
+        self._counter.add(len(data))
+
+
+class FakeI2C(object):
+    """I2C provider for the i2c= constructor parameter."""
+
+    def __init__(self, bulk=False):
+        self.counter = BusCounter()
+        self._bulk = bulk
+
+    def get_i2c_device(self, address, **kwargs):
+        if self._bulk:
+            return FakeBulkI2CDevice(self.counter)
+        return FakeI2CDevice(self.counter)
+
+
+class FakeSPI(object):
+    """SPI device for the spi= constructor parameter."""
+
+    def __init__(self):
+        self.counter = BusCounter()
+
+    def set_clock_hz(self, hz):
+        self.counter.clock_hz = hz
+
+    def write(self, data):
+        self.counter.add(len(data))
+
+
+class FakeGPIO(object):
+    """GPIO adapter for the gpio= constructor parameter."""
+
+    def setup(self, pin, mode, pull_up_down=None):
+        pass
+
+    def output(self, pin, value):
+        pass
+
+    def set_high(self, pin):
+        pass
+
+    def set_low(self, pin):
+        pass
+
+
+def bus_time(transport, counter, transactions, count, latency):
+    """Return a dict of the modeled seconds to send transactions carrying count
+    bytes, for each bus speed.  Every transaction also pays latency seconds of
+    driver overhead.
+    """
+    if transport == 'spi':
+        hz = counter.clock_hz or 8000000
+        return {'{0}MHz'.format(hz/1000000): count*8/hz + transactions*latency}
+    # Each I2C byte takes 9 clocks with its ACK, plus the address byte and a
+    # start and stop condition per transaction.
+    times = {}
+    for name, hz in I2C_SPEEDS:
+        times[name] = ((count + transactions)*9 + transactions*2)/hz + \
+                      transactions*latency
+    return times
+
+
+def make_display(panel, transport):
+    if transport == 'spi':
+        spi = FakeSPI()
+        disp = panel(None, dc=1, spi=spi, gpio=FakeGPIO())
+        return disp, spi.counter
+    i2c = FakeI2C(bulk=transport == 'i2c-bulk')
+    mode = 'bulk' if transport == 'i2c-bulk' else 'block'
+    disp = panel(None, i2c=i2c, gpio=FakeGPIO(), i2c_transfer=mode)
+    return disp, i2c.counter
+
+
+def measure(func, min_time, min_runs):
+    """Call func until min_time seconds and min_runs calls have passed, and
+    return the number of calls and the seconds they took.
+    """
+    runs = 0
+    start = _now()
+    elapsed = 0.0
+    while elapsed < min_time or runs < min_runs:
+        func()
+        runs += 1
+        elapsed = _now() - start
+    return runs, elapsed
+
+
+def random_image(width, height, seed):
+    rng = random.Random(seed)
+    data = bytes(bytearray(rng.getrandbits(8) for _ in range(width*height//8)))
+    return Image.frombytes('1', (width, height), data)
+
+
+def benchmarks(disp):
+    """Return (name, setup, func) for each benchmark of a display.  setup is
+    called once before timing starts.
+    """
+    width, height = disp.width, disp.height
+    image = random_image(width, height, 1)
+    frames = [bytearray(len(disp.buffer)), bytearray(b'\xff'*len(disp.buffer))]
+    state = {'frame': 0, 'x': 0}
+
+    def display_full():
+        # Alternate between two frames that differ in every byte.
+        state['frame'] ^= 1
+        disp.buffer[:] = frames[state['frame']]
+        disp.display()
+
+    def display_pixel():
+        # Change a single pixel, moving along the display.
+        x = state['x'] = (state['x'] + 1) % width
+        disp.pixel(x, x % height, not disp.get_pixel(x, x % height))
+        disp.display()
+
+    def display_unchanged():
+        disp.display()
+
+    def begin():
+        disp.begin()
+
+    def prime():
+        disp.begin()
+        disp.display()
+
+    def begin_warm():
+        disp.begin(warm=True)
+
+    return [('begin', None, begin),
+            ('begin_warm', None, begin_warm),
+            ('image', None, lambda: disp.image(image)),
+            ('clear', None, disp.clear),
+            ('display_full', prime, display_full),
+            ('display_pixel', prime, display_pixel),
+            ('display_unchanged', prime, display_unchanged)]
+
+
+def run(args):
+    results = []
+    for panel in PANELS:
+        for transport in TRANSPORTS:
+            disp, counter = make_display(panel, transport)
+            for name, setup, func in benchmarks(disp):
+                if args.filter and args.filter not in name:
+                    continue
+                if setup is not None:
+                    setup()
+                transactions, count = counter.transactions, counter.bytes
+                runs, elapsed = measure(func, args.min_time, args.min_runs)
+                transactions = (counter.transactions - transactions)/runs
+                count = (counter.bytes - count)/runs
+                result = {
+                    'panel': panel.__name__,
+                    'transport': transport,
+                    'benchmark': name,
+                    'runs': runs,
+                    'ops_per_sec': runs/elapsed,
+                    'transactions': transactions,
+                    'bytes': count,
+                    'bus_time': bus_time(transport, counter, transactions, count,
+                                         args.latency/1000000),
+                }
+                results.append(result)
+                report(result)
+    return results
+
+
+def report(result):
+    bus = ' '.join('{0}={1:.2f}ms'.format(name, seconds*1000)
+                   for name, seconds in result['bus_time'].items())
+    print('{panel:15} {transport:9} {benchmark:17} {ops_per_sec:12.1f}/s '
+          '{transactions:7.1f} tx {bytes:8.1f} B  {bus}'.format(bus=bus, **result))
+
+
+def compare(results, path):
+    with open(path) as f:
+        before = json.load(f)['results']
+    old = dict(((r['panel'], r['transport'], r['benchmark']), r) for r in before)
+    print('\nChange in ops/sec and bytes against {0}:'.format(path))
+    for result in results:
+        key = (result['panel'], result['transport'], result['benchmark'])
+        if key not in old:
+            continue
+        ops = result['ops_per_sec']/old[key]['ops_per_sec'] - 1
+        print('{0:15} {1:9} {2:17} {3:+8.1%} {4:+9.1f} B'.format(
+            key[0], key[1], key[2], ops, result['bytes'] - old[key]['bytes']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the SSD1306 library '
+                                     'against simulated buses.')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='Seconds to run each benchmark for at least.')
+    parser.add_argument('--min-runs', type=int, default=10,
+                        help='Calls to make of each benchmark at least.')
+    parser.add_argument('--latency', type=float, default=50.0,
+                        help='Modeled driver overhead of each bus transaction '
+                             'in microseconds.')
+    parser.add_argument('--filter', help='Only run benchmarks whose name '
+                        'contains this.')
+    parser.add_argument('--output', help='Save the results to this JSON file.')
+    parser.add_argument('--compare', help='Compare with results saved earlier.')
+    args = parser.parse_args()
+    results = run(args)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': platform.python_version(),
+                       'machine': platform.machine(),
+                       'time': time.time(),
+                       'latency_us': args.latency,
+                       'results': results}, f, indent=2, sort_keys=True)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
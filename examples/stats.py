@@ -23,8 +23,6 @@ import time
 import Adafruit_GPIO.SPI as SPI
 import Adafruit_SSD1306
 
-from PIL import Image
-from PIL import ImageDraw
 from PIL import ImageFont
 
 import subprocess
@@ -74,17 +72,9 @@ disp.begin()
 disp.clear()
 disp.display()
 
-# Create blank image for drawing.
-# Make sure to create image with mode '1' for 1-bit color.
+# Text is drawn straight into the display buffer, no image is needed.
 width = disp.width
 height = disp.height
-image = Image.new('1', (width, height))
-
-# Get drawing object to draw on image.
-draw = ImageDraw.Draw(image)
-
-# Draw a black filled box to clear the image.
-draw.rectangle((0,0,width,height), outline=0, fill=0)
 
 # Draw some shapes.
 # First define some constants to allow easy resizing of shapes.
@@ -95,17 +85,17 @@ bottom = height-padding
 x = 0
 
 
-# Load default font.
-font = ImageFont.load_default()
+# Load default font and rasterize it once into a glyph atlas.
+font = Adafruit_SSD1306.get_atlas(ImageFont.load_default())
 
 # Alternatively load a TTF font.  Make sure the .ttf font file is in the same directory as the python script!
 # Some other nice fonts to try: http://www.dafont.com/bitmap.php
-# font = ImageFont.truetype('Minecraftia.ttf', 8)
+# font = Adafruit_SSD1306.get_atlas('Minecraftia.ttf', 8)
 
 while True:
 
-    # Draw a black filled box to clear the image.
-    draw.rectangle((0,0,width,height), outline=0, fill=0)
+    # Clear the display buffer.
+    disp.clear()
 
     # Shell scripts for system monitoring from here : https://unix.stackexchange.com/questions/119126/command-to-display-memory-usage-disk-usage-and-cpu-load
     cmd = "hostname -I | cut -d\' \' -f1"
@@ -119,12 +109,11 @@ while True:
 
     # Write two lines of text.
 
-    draw.text((x, top),       "IP: " + str(IP),  font=font, fill=255)
-    draw.text((x, top+8),     str(CPU), font=font, fill=255)
-    draw.text((x, top+16),    str(MemUsage),  font=font, fill=255)
-    draw.text((x, top+25),    str(Disk),  font=font, fill=255)
+    disp.draw_text(x, top,       "IP: " + str(IP),  atlas=font)
+    disp.draw_text(x, top+8,     str(CPU), atlas=font)
+    disp.draw_text(x, top+16,    str(MemUsage),  atlas=font)
+    disp.draw_text(x, top+25,    str(Disk),  atlas=font)
 
-    # Display image.
-    disp.image(image)
+    # Display the changed part of the buffer.
     disp.display()
     time.sleep(.1)